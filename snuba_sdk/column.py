@@ -1,5 +1,8 @@
+from __future__ import annotations
+
 import re
 from dataclasses import dataclass, field
+from functools import lru_cache
 from typing import Optional, Union
 
 from snuba_sdk.entity import Entity
@@ -64,6 +67,18 @@ class Column(Expression):
             super().__setattr__("subscriptable", subscriptable)
             super().__setattr__("key", key)
 
+    @staticmethod
+    def get(name: str) -> Column:
+        """
+        Return a shared, already validated Column for the given name. Columns are
+        immutable, so code that builds the same column repeatedly (e.g. the MQL
+        parser) can reuse one instance instead of validating the name every time.
+
+        :param name: The column name.
+        :type name: str
+        """
+        return _get_column(name)
+
     def validate_data_model(self, match: Union[Entity, Storage]) -> None:
         if match.data_model is None:
             return
@@ -73,3 +88,8 @@ class Column(Expression):
             raise InvalidColumnError(
                 f"'{match.name}' does not support the column '{self.name}'"
             )
+
+
+@lru_cache(maxsize=1024)
+def _get_column(name: str) -> Column:
+    return Column(name)
@@ -64,6 +64,13 @@ OPERATOR_TO_FUNCTION: Mapping[Op, ConditionFunction] = {
     Op.NOT_LIKE: ConditionFunction.NOT_LIKE,
 }
 
+# MQL has no negated operators, a negated condition is a regular one prefixed with "!".
+OPERATOR_TO_MQL_PREFIX: Mapping[Op, str] = {
+    Op.NEQ: "!",
+    Op.NOT_IN: "!",
+    Op.NOT_LIKE: "!",
+}
+
 
 def is_unary(op: Op) -> bool:
     return op in [Op.IS_NULL, Op.IS_NOT_NULL]
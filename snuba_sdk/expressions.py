@@ -53,9 +53,8 @@ class InvalidArrayError(Exception):
 
 
 def list_type(vals: Sequence[Any], type_classes: Sequence[Any]) -> bool:
-    return isinstance(vals, list) and all(
-        isinstance(v, tuple(type_classes)) for v in vals
-    )
+    types = tuple(type_classes)
+    return isinstance(vals, list) and all(isinstance(v, types) for v in vals)
 
 
 def is_literal(value: Any) -> bool:
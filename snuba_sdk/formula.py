@@ -87,8 +87,9 @@ class Formula:
                 f"parameters of formula {self.function_name} must be a Sequence"
             )
 
+        parameter_types = tuple(FormulaParameter)
         for param in self.parameters:
-            if not isinstance(param, tuple(FormulaParameter)):
+            if not isinstance(param, parameter_types):
                 raise InvalidFormulaError(
                     f"parameter '{param}' of formula {self.function_name} is an invalid type"
                 )
@@ -6,6 +6,7 @@ Use `parse_mql()` to parse an MQL string into a MetricsQuery.
 from __future__ import annotations
 
 from dataclasses import dataclass
+from functools import lru_cache
 from typing import Any, Mapping, Sequence, Union, cast
 
 from parsimonious.exceptions import ParseError
@@ -127,14 +128,21 @@ def parse_mql(mql: str) -> Timeseries | Formula:
     Parse a MQL string into a Timeseries object.
     """
     try:
-        tree = MQL_GRAMMAR.parse(mql.strip())
+        tree = _parse_tree(mql.strip())
     except ParseError as e:
         raise InvalidMQLQueryError("Invalid metrics syntax") from e
-    result = MQLVisitor().visit(tree)
+    result = MQL_VISITOR.visit(tree)
     assert isinstance(result, (Timeseries, Formula))
     return result
 
 
+@lru_cache(maxsize=1024)
+def _parse_tree(mql: str) -> Node:
+    # Only the parse tree is cached. It is never modified by the visitor, which
+    # builds fresh objects from it on every call since a Timeseries is mutable.
+    return MQL_GRAMMAR.parse(mql)
+
+
 class MQLVisitor(NodeVisitor):  # type: ignore
     def visit(self, node: Node) -> Any:
         """Walk a parse tree, transforming it into a MetricsQuery object.
@@ -344,7 +352,7 @@ class MQLVisitor(NodeVisitor):  # type: ignore
         return Op(node.text)
 
     def visit_tag_key(self, node: Node, children: Sequence[Any]) -> Column:
-        return Column(node.text)
+        return Column.get(node.text)
 
     def visit_tag_value(
         self, node: Node, children: Sequence[FilterFactor]
@@ -395,7 +403,7 @@ class MQLVisitor(NodeVisitor):  # type: ignore
         )
 
     def visit_group_by_name(self, node: Node, children: Sequence[Any]) -> Column:
-        return Column(node.text)
+        return Column.get(node.text)
 
     def visit_group_by_name_tuple(
         self, node: Node, children: Sequence[Any]
@@ -592,6 +600,10 @@ class MQLVisitor(NodeVisitor):  # type: ignore
         return children
 
 
+# The visitor keeps no state between visits, so one instance serves every parse.
+MQL_VISITOR = MQLVisitor()
+
+
 @dataclass
 class FilterFactor(object):
     value: str | Sequence[str] | Condition | BooleanCondition
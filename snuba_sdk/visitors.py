@@ -7,7 +7,12 @@ from typing import Any, Generator, Generic, Set, TypeVar
 
 from snuba_sdk.aliased_expression import AliasedExpression
 from snuba_sdk.column import Column
-from snuba_sdk.conditions import BooleanCondition, Condition, Op, is_unary
+from snuba_sdk.conditions import (
+    OPERATOR_TO_MQL_PREFIX,
+    BooleanCondition,
+    Condition,
+    is_unary,
+)
 from snuba_sdk.entity import Entity
 from snuba_sdk.storage import Storage
 from snuba_sdk.expressions import (
@@ -305,9 +310,7 @@ class Translation(ExpressionVisitor[str]):
             rhs = f"{self._stringify_scalar(cond.rhs)}"
 
         assert rhs is not None
-        op = ""
-        if cond.op == Op.NEQ or cond.op == Op.NOT_IN or cond.op == Op.NOT_LIKE:
-            op = "!"
+        op = OPERATOR_TO_MQL_PREFIX.get(cond.op, "")
         return f"{op}{self.visit(cond.lhs)}:{rhs}"
 
     def _visit_boolean_condition(self, cond: BooleanCondition) -> str:
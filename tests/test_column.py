@@ -112,6 +112,18 @@ def test_columns(
         assert TRANSLATOR.visit(exp) == translated
 
 
+def test_cached_columns() -> None:
+    column = Column.get("tags[foo]")
+    assert column is Column.get("tags[foo]")
+    assert column == Column("tags[foo]")
+
+    with pytest.raises(
+        InvalidColumnError,
+        match=re.escape("column '..valid' is empty or contains invalid characters"),
+    ):
+        Column.get("..valid")
+
+
 entity_tests = [
     pytest.param("foo", Entity("events", "e"), "e.foo", None, id="column with entity"),
     pytest.param(
@@ -1,8 +1,8 @@
 from __future__ import annotations
 
-import re
+from copy import deepcopy
 from datetime import datetime, timedelta, timezone
-from typing import Any
+from typing import Any, Callable
 
 import pytest
 
@@ -17,140 +17,122 @@ from snuba_sdk.orderby import Direction
 from snuba_sdk.timeseries import Metric, MetricsScope, Rollup, Timeseries
 
 NOW = datetime(2023, 1, 2, 3, 4, 5, 0, timezone.utc)
+END = NOW + timedelta(days=14)
+
+DEFAULT_ROLLUP_DICT: dict[str, Any] = {
+    "orderby": None,
+    "granularity": 3600,
+    "interval": 3600,
+    "with_totals": None,
+}
+DEFAULT_SCOPE_DICT: dict[str, Any] = {
+    "org_ids": [1],
+    "project_ids": [11],
+    "use_case_id": "transactions",
+}
+
+
+def build_context(
+    rollup: dict[str, Any] | None = None,
+    limit: int | None = None,
+    offset: int | None = None,
+    extrapolate: bool | None = None,
+    indexer_mappings: dict[str, str | int] | None = None,
+) -> dict[str, Any]:
+    """
+    Build the expected MQL context of a query over the default time range and scope.
+    """
+    return {
+        "start": "2023-01-02T03:04:05+00:00",
+        "end": "2023-01-16T03:04:05+00:00",
+        "rollup": rollup or deepcopy(DEFAULT_ROLLUP_DICT),
+        "scope": deepcopy(DEFAULT_SCOPE_DICT),
+        "limit": limit,
+        "offset": offset,
+        "extrapolate": extrapolate,
+        "indexer_mappings": indexer_mappings or {},
+    }
+
+
+# Metrics are frozen, so a single instance can be shared across all the test cases.
+TXN_DURATION_MRI_METRIC = Metric(mri="d:transactions/duration@millisecond")
+TXN_DURATION_METRIC = Metric(public_name="transaction.duration")
+FOO_METRIC = Metric(public_name="foo")
+BAR_METRIC = Metric(public_name="bar")
+
+# Neither validation nor serialization mutates the scope or the rollup, so they are
+# shared as well.
+SCOPE = MetricsScope(org_ids=[1], project_ids=[11], use_case_id="transactions")
+HOURLY_ROLLUP = Rollup(interval=3600, totals=None, granularity=3600)
+
+
+def build_query(**overrides: Any) -> MetricsQuery:
+    """
+    Build a query over the default time range, rollup and scope, with any of the
+    fields overridden by the caller.
+    """
+    fields: dict[str, Any] = {
+        "start": NOW,
+        "end": END,
+        "rollup": HOURLY_ROLLUP,
+        "scope": SCOPE,
+        "indexer_mappings": {},
+    }
+    fields.update(overrides)
+    return MetricsQuery(**fields)
 
 
 metrics_query_timeseries_to_mql_tests = [
     pytest.param(
-        MetricsQuery(
+        lambda: build_query(
             query=Timeseries(
-                metric=Metric(
-                    mri="d:transactions/duration@millisecond",
-                ),
+                metric=TXN_DURATION_MRI_METRIC,
                 aggregate="max",
                 aggregate_params=None,
                 filters=None,
                 groupby=None,
             ),
-            start=NOW,
-            end=NOW + timedelta(days=14),
-            rollup=Rollup(interval=3600, totals=None, granularity=3600),
-            scope=MetricsScope(
-                org_ids=[1], project_ids=[11], use_case_id="transactions"
-            ),
-            indexer_mappings={},
         ),
         {
             "mql": "max(d:transactions/duration@millisecond)",
-            "mql_context": {
-                "start": "2023-01-02T03:04:05+00:00",
-                "end": "2023-01-16T03:04:05+00:00",
-                "rollup": {
-                    "orderby": None,
-                    "granularity": 3600,
-                    "interval": 3600,
-                    "with_totals": None,
-                },
-                "scope": {
-                    "org_ids": [1],
-                    "project_ids": [11],
-                    "use_case_id": "transactions",
-                },
-                "limit": None,
-                "offset": None,
-                "extrapolate": None,
-                "indexer_mappings": {},
-            },
+            "mql_context": build_context(),
         },
         id="basic mri query",
     ),
     pytest.param(
-        MetricsQuery(
+        lambda: build_query(
             query=Timeseries(
-                metric=Metric(
-                    mri="d:transactions/duration@millisecond",
-                ),
+                metric=TXN_DURATION_MRI_METRIC,
                 aggregate="quantiles",
                 aggregate_params=[0.5],
                 filters=None,
                 groupby=None,
             ),
-            start=NOW,
-            end=NOW + timedelta(days=14),
-            rollup=Rollup(interval=3600, totals=None, granularity=3600),
-            scope=MetricsScope(
-                org_ids=[1], project_ids=[11], use_case_id="transactions"
-            ),
-            indexer_mappings={},
         ),
         {
             "mql": "quantiles(0.5)(d:transactions/duration@millisecond)",
-            "mql_context": {
-                "start": "2023-01-02T03:04:05+00:00",
-                "end": "2023-01-16T03:04:05+00:00",
-                "rollup": {
-                    "orderby": None,
-                    "granularity": 3600,
-                    "interval": 3600,
-                    "with_totals": None,
-                },
-                "scope": {
-                    "org_ids": [1],
-                    "project_ids": [11],
-                    "use_case_id": "transactions",
-                },
-                "limit": None,
-                "offset": None,
-                "extrapolate": None,
-                "indexer_mappings": {},
-            },
+            "mql_context": build_context(),
         },
         id="basic curried query",
     ),
     pytest.param(
-        MetricsQuery(
+        lambda: build_query(
             query=Timeseries(
-                metric=Metric(
-                    mri="d:transactions/duration@millisecond",
-                ),
+                metric=TXN_DURATION_MRI_METRIC,
                 aggregate="topK",
                 aggregate_params=[10],
                 filters=None,
                 groupby=None,
             ),
-            start=NOW,
-            end=NOW + timedelta(days=14),
-            rollup=Rollup(interval=3600, totals=None, granularity=3600),
-            scope=MetricsScope(
-                org_ids=[1], project_ids=[11], use_case_id="transactions"
-            ),
-            indexer_mappings={},
         ),
         {
             "mql": "topK(10)(d:transactions/duration@millisecond)",
-            "mql_context": {
-                "start": "2023-01-02T03:04:05+00:00",
-                "end": "2023-01-16T03:04:05+00:00",
-                "rollup": {
-                    "orderby": None,
-                    "granularity": 3600,
-                    "interval": 3600,
-                    "with_totals": None,
-                },
-                "scope": {
-                    "org_ids": [1],
-                    "project_ids": [11],
-                    "use_case_id": "transactions",
-                },
-                "limit": None,
-                "offset": None,
-                "extrapolate": None,
-                "indexer_mappings": {},
-            },
+            "mql_context": build_context(),
         },
         id="basic arbitrary curried query",
     ),
     pytest.param(
-        MetricsQuery(
+        lambda: build_query(
             query=Timeseries(
                 metric=Metric(
                     public_name="transactions.duration",
@@ -160,216 +142,89 @@ metrics_query_timeseries_to_mql_tests = [
                 filters=None,
                 groupby=None,
             ),
-            start=NOW,
-            end=NOW + timedelta(days=14),
             rollup=Rollup(totals=True, orderby=Direction.DESC, granularity=3600),
-            scope=MetricsScope(
-                org_ids=[1], project_ids=[11], use_case_id="transactions"
-            ),
-            indexer_mappings={},
         ),
         {
             "mql": "max(transactions.duration)",
-            "mql_context": {
-                "start": "2023-01-02T03:04:05+00:00",
-                "end": "2023-01-16T03:04:05+00:00",
-                "rollup": {
+            "mql_context": build_context(
+                rollup={
                     "orderby": "DESC",
                     "granularity": 3600,
                     "interval": None,
                     "with_totals": "True",
-                },
-                "scope": {
-                    "org_ids": [1],
-                    "project_ids": [11],
-                    "use_case_id": "transactions",
-                },
-                "limit": None,
-                "offset": None,
-                "extrapolate": None,
-                "indexer_mappings": {},
-            },
+                }
+            ),
         },
         id="basic public name query",
     ),
     pytest.param(
-        MetricsQuery(
+        lambda: build_query(
             query=Timeseries(
-                metric=Metric(
-                    mri="d:transactions/duration@millisecond",
-                ),
+                metric=TXN_DURATION_MRI_METRIC,
                 aggregate="max",
                 aggregate_params=None,
                 filters=[Condition(Column("bar"), Op.EQ, "baz")],
                 groupby=None,
             ),
-            start=NOW,
-            end=NOW + timedelta(days=14),
-            rollup=Rollup(interval=3600, totals=None, granularity=3600),
-            scope=MetricsScope(
-                org_ids=[1], project_ids=[11], use_case_id="transactions"
-            ),
-            indexer_mappings={},
         ),
         {
             "mql": 'max(d:transactions/duration@millisecond){bar:"baz"}',
-            "mql_context": {
-                "start": "2023-01-02T03:04:05+00:00",
-                "end": "2023-01-16T03:04:05+00:00",
-                "rollup": {
-                    "orderby": None,
-                    "granularity": 3600,
-                    "interval": 3600,
-                    "with_totals": None,
-                },
-                "scope": {
-                    "org_ids": [1],
-                    "project_ids": [11],
-                    "use_case_id": "transactions",
-                },
-                "limit": None,
-                "offset": None,
-                "extrapolate": None,
-                "indexer_mappings": {},
-            },
+            "mql_context": build_context(),
         },
         id="filter query",
     ),
     pytest.param(
-        MetricsQuery(
+        lambda: build_query(
             query=Timeseries(
-                metric=Metric(
-                    mri="d:transactions/duration@millisecond",
-                ),
+                metric=TXN_DURATION_MRI_METRIC,
                 aggregate="max",
                 aggregate_params=None,
                 filters=[Condition(Column("bar"), Op.IN, ["baz", "bap"])],
                 groupby=None,
             ),
-            start=NOW,
-            end=NOW + timedelta(days=14),
-            rollup=Rollup(interval=3600, totals=None, granularity=3600),
-            scope=MetricsScope(
-                org_ids=[1], project_ids=[11], use_case_id="transactions"
-            ),
-            indexer_mappings={},
         ),
         {
             "mql": 'max(d:transactions/duration@millisecond){bar:["baz", "bap"]}',
-            "mql_context": {
-                "start": "2023-01-02T03:04:05+00:00",
-                "end": "2023-01-16T03:04:05+00:00",
-                "rollup": {
-                    "orderby": None,
-                    "granularity": 3600,
-                    "interval": 3600,
-                    "with_totals": None,
-                },
-                "scope": {
-                    "org_ids": [1],
-                    "project_ids": [11],
-                    "use_case_id": "transactions",
-                },
-                "limit": None,
-                "offset": None,
-                "extrapolate": None,
-                "indexer_mappings": {},
-            },
+            "mql_context": build_context(),
         },
         id="in filter query",
     ),
     pytest.param(
-        MetricsQuery(
+        lambda: build_query(
             query=Timeseries(
-                metric=Metric(
-                    mri="d:transactions/duration@millisecond",
-                ),
+                metric=TXN_DURATION_MRI_METRIC,
                 aggregate="max",
                 aggregate_params=None,
                 filters=[Condition(Column("bar"), Op.LIKE, "baz*")],
                 groupby=None,
             ),
-            start=NOW,
-            end=NOW + timedelta(days=14),
-            rollup=Rollup(interval=3600, totals=None, granularity=3600),
-            scope=MetricsScope(
-                org_ids=[1], project_ids=[11], use_case_id="transactions"
-            ),
-            indexer_mappings={},
         ),
         {
             "mql": 'max(d:transactions/duration@millisecond){bar:"baz*"}',
-            "mql_context": {
-                "start": "2023-01-02T03:04:05+00:00",
-                "end": "2023-01-16T03:04:05+00:00",
-                "rollup": {
-                    "orderby": None,
-                    "granularity": 3600,
-                    "interval": 3600,
-                    "with_totals": None,
-                },
-                "scope": {
-                    "org_ids": [1],
-                    "project_ids": [11],
-                    "use_case_id": "transactions",
-                },
-                "limit": None,
-                "offset": None,
-                "extrapolate": None,
-                "indexer_mappings": {},
-            },
+            "mql_context": build_context(),
         },
         id="wildcard filter query",
     ),
     pytest.param(
-        MetricsQuery(
+        lambda: build_query(
             query=Timeseries(
-                metric=Metric(
-                    mri="d:transactions/duration@millisecond",
-                ),
+                metric=TXN_DURATION_MRI_METRIC,
                 aggregate="max",
                 aggregate_params=None,
                 filters=[Condition(Column("bar"), Op.NOT_LIKE, "baz*")],
                 groupby=None,
             ),
-            start=NOW,
-            end=NOW + timedelta(days=14),
-            rollup=Rollup(interval=3600, totals=None, granularity=3600),
-            scope=MetricsScope(
-                org_ids=[1], project_ids=[11], use_case_id="transactions"
-            ),
-            indexer_mappings={},
         ),
         {
             "mql": 'max(d:transactions/duration@millisecond){!bar:"baz*"}',
-            "mql_context": {
-                "start": "2023-01-02T03:04:05+00:00",
-                "end": "2023-01-16T03:04:05+00:00",
-                "rollup": {
-                    "orderby": None,
-                    "granularity": 3600,
-                    "interval": 3600,
-                    "with_totals": None,
-                },
-                "scope": {
-                    "org_ids": [1],
-                    "project_ids": [11],
-                    "use_case_id": "transactions",
-                },
-                "limit": None,
-                "offset": None,
-                "extrapolate": None,
-                "indexer_mappings": {},
-            },
+            "mql_context": build_context(),
         },
         id="negated wildcard filter query",
     ),
     pytest.param(
-        MetricsQuery(
+        lambda: build_query(
             query=Timeseries(
-                metric=Metric(
-                    mri="d:transactions/duration@millisecond",
-                ),
+                metric=TXN_DURATION_MRI_METRIC,
                 aggregate="max",
                 aggregate_params=None,
                 filters=[
@@ -383,44 +238,17 @@ metrics_query_timeseries_to_mql_tests = [
                 ],
                 groupby=None,
             ),
-            start=NOW,
-            end=NOW + timedelta(days=14),
-            rollup=Rollup(interval=3600, totals=None, granularity=3600),
-            scope=MetricsScope(
-                org_ids=[1], project_ids=[11], use_case_id="transactions"
-            ),
-            indexer_mappings={},
         ),
         {
             "mql": 'max(d:transactions/duration@millisecond){(!bar:"baz*" AND foo:"prefix*")}',
-            "mql_context": {
-                "start": "2023-01-02T03:04:05+00:00",
-                "end": "2023-01-16T03:04:05+00:00",
-                "rollup": {
-                    "orderby": None,
-                    "granularity": 3600,
-                    "interval": 3600,
-                    "with_totals": None,
-                },
-                "scope": {
-                    "org_ids": [1],
-                    "project_ids": [11],
-                    "use_case_id": "transactions",
-                },
-                "limit": None,
-                "offset": None,
-                "extrapolate": None,
-                "indexer_mappings": {},
-            },
+            "mql_context": build_context(),
         },
         id="multiple wildcard filters query",
     ),
     pytest.param(
-        MetricsQuery(
+        lambda: build_query(
             query=Timeseries(
-                metric=Metric(
-                    mri="d:transactions/duration@millisecond",
-                ),
+                metric=TXN_DURATION_MRI_METRIC,
                 aggregate="max",
                 aggregate_params=None,
                 filters=[
@@ -443,177 +271,73 @@ metrics_query_timeseries_to_mql_tests = [
                 ],
                 groupby=None,
             ),
-            start=NOW,
-            end=NOW + timedelta(days=14),
-            rollup=Rollup(interval=3600, totals=None, granularity=3600),
-            scope=MetricsScope(
-                org_ids=[1], project_ids=[11], use_case_id="transactions"
-            ),
-            indexer_mappings={},
         ),
         {
             "mql": 'max(d:transactions/duration@millisecond){bar:"baz" AND foo:"foz" AND (foo:"foz" OR hee:"hez" OR (foo:"foz" AND hee:"hez"))}',
-            "mql_context": {
-                "start": "2023-01-02T03:04:05+00:00",
-                "end": "2023-01-16T03:04:05+00:00",
-                "rollup": {
-                    "orderby": None,
-                    "granularity": 3600,
-                    "interval": 3600,
-                    "with_totals": None,
-                },
-                "scope": {
-                    "org_ids": [1],
-                    "project_ids": [11],
-                    "use_case_id": "transactions",
-                },
-                "limit": None,
-                "offset": None,
-                "extrapolate": None,
-                "indexer_mappings": {},
-            },
+            "mql_context": build_context(),
         },
         id="multiple nested filters query",
     ),
     pytest.param(
-        MetricsQuery(
+        lambda: build_query(
             query=Timeseries(
-                metric=Metric(
-                    mri="d:transactions/duration@millisecond",
-                ),
+                metric=TXN_DURATION_MRI_METRIC,
                 aggregate="max",
                 aggregate_params=None,
                 filters=None,
                 groupby=[Column("transaction")],
             ),
-            start=NOW,
-            end=NOW + timedelta(days=14),
-            rollup=Rollup(interval=3600, totals=None, granularity=3600),
-            scope=MetricsScope(
-                org_ids=[1], project_ids=[11], use_case_id="transactions"
-            ),
-            indexer_mappings={},
         ),
         {
             "mql": "max(d:transactions/duration@millisecond) by (transaction)",
-            "mql_context": {
-                "start": "2023-01-02T03:04:05+00:00",
-                "end": "2023-01-16T03:04:05+00:00",
-                "rollup": {
-                    "orderby": None,
-                    "granularity": 3600,
-                    "interval": 3600,
-                    "with_totals": None,
-                },
-                "scope": {
-                    "org_ids": [1],
-                    "project_ids": [11],
-                    "use_case_id": "transactions",
-                },
-                "limit": None,
-                "offset": None,
-                "extrapolate": None,
-                "indexer_mappings": {},
-            },
+            "mql_context": build_context(),
         },
         id="groupby query",
     ),
     pytest.param(
-        MetricsQuery(
+        lambda: build_query(
             query=Timeseries(
-                metric=Metric(
-                    mri="d:transactions/duration@millisecond",
-                ),
+                metric=TXN_DURATION_MRI_METRIC,
                 aggregate="max",
                 aggregate_params=None,
                 filters=None,
                 groupby=[Column("a"), Column("b")],
             ),
-            start=NOW,
-            end=NOW + timedelta(days=14),
-            rollup=Rollup(interval=3600, totals=None, granularity=3600),
-            scope=MetricsScope(
-                org_ids=[1], project_ids=[11], use_case_id="transactions"
-            ),
             extrapolate=Extrapolate(False),
             indexer_mappings={"d:transactions/duration@millisecond": 11235813},
         ),
         {
             "mql": "max(d:transactions/duration@millisecond) by (a, b)",
-            "mql_context": {
-                "start": "2023-01-02T03:04:05+00:00",
-                "end": "2023-01-16T03:04:05+00:00",
-                "rollup": {
-                    "orderby": None,
-                    "granularity": 3600,
-                    "interval": 3600,
-                    "with_totals": None,
-                },
-                "scope": {
-                    "org_ids": [1],
-                    "project_ids": [11],
-                    "use_case_id": "transactions",
-                },
-                "limit": None,
-                "offset": None,
-                "extrapolate": False,
-                "indexer_mappings": {"d:transactions/duration@millisecond": 11235813},
-            },
+            "mql_context": build_context(
+                extrapolate=False,
+                indexer_mappings={"d:transactions/duration@millisecond": 11235813},
+            ),
         },
         id="multiple groupby query",
     ),
     pytest.param(
-        MetricsQuery(
+        lambda: build_query(
             query=Timeseries(
-                metric=Metric(
-                    mri="d:transactions/duration@millisecond",
-                ),
+                metric=TXN_DURATION_MRI_METRIC,
                 aggregate="max",
                 aggregate_params=None,
                 filters=[Condition(Column("bar"), Op.EQ, "baz")],
                 groupby=[Column("transaction")],
             ),
-            start=NOW,
-            end=NOW + timedelta(days=14),
-            rollup=Rollup(interval=3600, totals=None, granularity=3600),
-            scope=MetricsScope(
-                org_ids=[1], project_ids=[11], use_case_id="transactions"
-            ),
             limit=Limit(100),
             offset=Offset(5),
             extrapolate=Extrapolate(True),
-            indexer_mappings={},
         ),
         {
             "mql": 'max(d:transactions/duration@millisecond){bar:"baz"} by (transaction)',
-            "mql_context": {
-                "start": "2023-01-02T03:04:05+00:00",
-                "end": "2023-01-16T03:04:05+00:00",
-                "rollup": {
-                    "orderby": None,
-                    "granularity": 3600,
-                    "interval": 3600,
-                    "with_totals": None,
-                },
-                "scope": {
-                    "org_ids": [1],
-                    "project_ids": [11],
-                    "use_case_id": "transactions",
-                },
-                "limit": 100,
-                "offset": 5,
-                "extrapolate": True,
-                "indexer_mappings": {},
-            },
+            "mql_context": build_context(limit=100, offset=5, extrapolate=True),
         },
         id="complex single timeseries query",
     ),
     pytest.param(
-        MetricsQuery(
+        lambda: build_query(
             query=Timeseries(
-                metric=Metric(
-                    mri="d:transactions/duration@millisecond",
-                ),
+                metric=TXN_DURATION_MRI_METRIC,
                 aggregate="max",
                 aggregate_params=None,
                 filters=[
@@ -625,120 +349,43 @@ metrics_query_timeseries_to_mql_tests = [
                 ],
                 groupby=[Column("transaction")],
             ),
-            start=NOW,
-            end=NOW + timedelta(days=14),
-            rollup=Rollup(interval=3600, totals=None, granularity=3600),
-            scope=MetricsScope(
-                org_ids=[1], project_ids=[11], use_case_id="transactions"
-            ),
             limit=Limit(100),
             offset=Offset(5),
-            indexer_mappings={},
         ),
         {
             "mql": 'max(d:transactions/duration@millisecond){bar:" !\\"#$%&\'()*+,-./0123456789:;<=>?@ABCDEFGHIJKLMNOPQRSTUVWXYZ[\\\\]^_`abcdefghijklmnopqrstuvwxyz{|}~"} by (transaction)',
-            "mql_context": {
-                "start": "2023-01-02T03:04:05+00:00",
-                "end": "2023-01-16T03:04:05+00:00",
-                "rollup": {
-                    "orderby": None,
-                    "granularity": 3600,
-                    "interval": 3600,
-                    "with_totals": None,
-                },
-                "scope": {
-                    "org_ids": [1],
-                    "project_ids": [11],
-                    "use_case_id": "transactions",
-                },
-                "limit": 100,
-                "offset": 5,
-                "extrapolate": None,
-                "indexer_mappings": {},
-            },
+            "mql_context": build_context(limit=100, offset=5),
         },
         id="test_crazy_characters",
     ),
     pytest.param(
-        MetricsQuery(
+        lambda: build_query(
             query="sum(transaction.duration){status_code:500} by transaction",
-            start=NOW,
-            end=NOW + timedelta(days=14),
-            rollup=Rollup(interval=3600, totals=None, granularity=3600),
-            scope=MetricsScope(
-                org_ids=[1], project_ids=[11], use_case_id="transactions"
-            ),
             limit=Limit(100),
             offset=Offset(5),
-            indexer_mappings={},
         ),
         {
             "mql": 'sum(transaction.duration){status_code:"500"} by (transaction)',
-            "mql_context": {
-                "start": "2023-01-02T03:04:05+00:00",
-                "end": "2023-01-16T03:04:05+00:00",
-                "rollup": {
-                    "orderby": None,
-                    "granularity": 3600,
-                    "interval": 3600,
-                    "with_totals": None,
-                },
-                "scope": {
-                    "org_ids": [1],
-                    "project_ids": [11],
-                    "use_case_id": "transactions",
-                },
-                "limit": 100,
-                "offset": 5,
-                "extrapolate": None,
-                "indexer_mappings": {},
-            },
+            "mql_context": build_context(limit=100, offset=5),
         },
         id="test_passing_string_directly",
     ),
     pytest.param(
-        MetricsQuery(
+        lambda: build_query(
             query="-sum(transaction.duration) + -1",
-            start=NOW,
-            end=NOW + timedelta(days=14),
-            rollup=Rollup(interval=3600, totals=None, granularity=3600),
-            scope=MetricsScope(
-                org_ids=[1], project_ids=[11], use_case_id="transactions"
-            ),
             limit=Limit(100),
             offset=Offset(5),
-            indexer_mappings={},
         ),
         {
             "mql": "(-(sum(transaction.duration)) + -1.0)",
-            "mql_context": {
-                "start": "2023-01-02T03:04:05+00:00",
-                "end": "2023-01-16T03:04:05+00:00",
-                "rollup": {
-                    "orderby": None,
-                    "granularity": 3600,
-                    "interval": 3600,
-                    "with_totals": None,
-                },
-                "scope": {
-                    "org_ids": [1],
-                    "project_ids": [11],
-                    "use_case_id": "transactions",
-                },
-                "limit": 100,
-                "offset": 5,
-                "extrapolate": None,
-                "indexer_mappings": {},
-            },
+            "mql_context": build_context(limit=100, offset=5),
         },
         id="test_unary_negation",
     ),
     pytest.param(
-        MetricsQuery(
+        lambda: build_query(
             query=Timeseries(
-                metric=Metric(
-                    mri="d:transactions/duration@millisecond",
-                ),
+                metric=TXN_DURATION_MRI_METRIC,
                 aggregate="max",
                 aggregate_params=None,
                 filters=[
@@ -753,222 +400,104 @@ metrics_query_timeseries_to_mql_tests = [
                 ],
                 groupby=None,
             ),
-            start=NOW,
-            end=NOW + timedelta(days=14),
-            rollup=Rollup(interval=3600, totals=None, granularity=3600),
-            scope=MetricsScope(
-                org_ids=[1], project_ids=[11], use_case_id="transactions"
-            ),
-            indexer_mappings={},
         ),
         {
             "mql": 'max(d:transactions/duration@millisecond){transaction:["a", "b", "c"]}',
-            "mql_context": {
-                "start": "2023-01-02T03:04:05+00:00",
-                "end": "2023-01-16T03:04:05+00:00",
-                "rollup": {
-                    "orderby": None,
-                    "granularity": 3600,
-                    "interval": 3600,
-                    "with_totals": None,
-                },
-                "scope": {
-                    "org_ids": [1],
-                    "project_ids": [11],
-                    "use_case_id": "transactions",
-                },
-                "limit": None,
-                "offset": None,
-                "extrapolate": None,
-                "indexer_mappings": {},
-            },
+            "mql_context": build_context(),
         },
         id="or_optimizer_query",
     ),
 ]
 
 
-@pytest.mark.parametrize("query, translated", metrics_query_timeseries_to_mql_tests)
-def test_metrics_query_to_mql_timeseries(
-    query: MetricsQuery, translated: dict[str, Any]
-) -> None:
-    query.validate()
-    serialized = query.serialize()
-    assert isinstance(serialized, dict)
-    assert serialized["mql"] == translated["mql"]
-    assert serialized["mql_context"] == translated["mql_context"]
-    assert (
-        parse_mql(str(serialized["mql"])) is not None
-    )  # ensure we can parse our own encoding
-
-
 invalid_metrics_query_to_mql_tests = [
     pytest.param(
-        MetricsQuery(
+        lambda: build_query(
             query=None,
-            start=NOW,
-            end=NOW + timedelta(days=14),
-            rollup=Rollup(interval=3600, totals=None, granularity=3600),
-            scope=MetricsScope(
-                org_ids=[1], project_ids=[11], use_case_id="transactions"
-            ),
         ),
-        InvalidMetricsQueryError("query is required for a metrics query"),
+        "query is required for a metrics query",
         id="missing query",
     ),
 ]
 
 
-@pytest.mark.parametrize("query, exception", invalid_metrics_query_to_mql_tests)
+@pytest.mark.parametrize("query_factory, message", invalid_metrics_query_to_mql_tests)
 def test_invalid_metrics_query_to_mql_tests(
-    query: MetricsQuery, exception: Exception
+    query_factory: Callable[[], MetricsQuery], message: str
 ) -> None:
-    with pytest.raises(type(exception), match=re.escape(str(exception))):
+    query = query_factory()
+    with pytest.raises(InvalidMetricsQueryError) as exc_info:
         query.validate()
+    assert str(exc_info.value) == message
 
 
 metrics_query_formula_to_mql_tests = [
     pytest.param(
-        MetricsQuery(
+        lambda: build_query(
             query=Formula(
                 ArithmeticOperator.DIVIDE.value,
                 [
                     Timeseries(
-                        metric=Metric(public_name="foo"),
+                        metric=FOO_METRIC,
                         aggregate="sum",
                     ),
                     1000,
                 ],
             ),
-            start=NOW,
-            end=NOW + timedelta(days=14),
-            rollup=Rollup(interval=3600, totals=None, granularity=3600),
-            scope=MetricsScope(
-                org_ids=[1], project_ids=[11], use_case_id="transactions"
-            ),
             limit=Limit(100),
             offset=Offset(5),
-            indexer_mappings={},
         ),
         {
             "mql": "(sum(foo) / 1000)",
-            "mql_context": {
-                "start": "2023-01-02T03:04:05+00:00",
-                "end": "2023-01-16T03:04:05+00:00",
-                "rollup": {
-                    "orderby": None,
-                    "granularity": 3600,
-                    "interval": 3600,
-                    "with_totals": None,
-                },
-                "scope": {
-                    "org_ids": [1],
-                    "project_ids": [11],
-                    "use_case_id": "transactions",
-                },
-                "limit": 100,
-                "offset": 5,
-                "extrapolate": None,
-                "indexer_mappings": {},
-            },
+            "mql_context": build_context(limit=100, offset=5),
         },
         id="test_terms",
     ),
     pytest.param(
-        MetricsQuery(
+        lambda: build_query(
             query=Formula(
                 "apdex",
                 [
                     Timeseries(
-                        metric=Metric(public_name="foo"),
+                        metric=FOO_METRIC,
                         aggregate="sum",
                     ),
                     1000,
                 ],
             ),
-            start=NOW,
-            end=NOW + timedelta(days=14),
-            rollup=Rollup(interval=3600, totals=None, granularity=3600),
-            scope=MetricsScope(
-                org_ids=[1], project_ids=[11], use_case_id="transactions"
-            ),
             limit=Limit(100),
             offset=Offset(5),
-            indexer_mappings={},
         ),
         {
             "mql": "apdex(sum(foo), 1000)",
-            "mql_context": {
-                "start": "2023-01-02T03:04:05+00:00",
-                "end": "2023-01-16T03:04:05+00:00",
-                "rollup": {
-                    "orderby": None,
-                    "granularity": 3600,
-                    "interval": 3600,
-                    "with_totals": None,
-                },
-                "scope": {
-                    "org_ids": [1],
-                    "project_ids": [11],
-                    "use_case_id": "transactions",
-                },
-                "limit": 100,
-                "offset": 5,
-                "extrapolate": None,
-                "indexer_mappings": {},
-            },
+            "mql_context": build_context(limit=100, offset=5),
         },
         id="test arbitrary function",
     ),
     pytest.param(
-        MetricsQuery(
+        lambda: build_query(
             query=Formula(
                 "apdex",
                 [
                     Timeseries(
-                        metric=Metric(public_name="foo"),
+                        metric=FOO_METRIC,
                         aggregate="quantiles",
                         aggregate_params=[0.5],
                     ),
                     1000,
                 ],
             ),
-            start=NOW,
-            end=NOW + timedelta(days=14),
-            rollup=Rollup(interval=3600, totals=None, granularity=3600),
-            scope=MetricsScope(
-                org_ids=[1], project_ids=[11], use_case_id="transactions"
-            ),
             limit=Limit(100),
             offset=Offset(5),
-            indexer_mappings={},
         ),
         {
             "mql": "apdex(quantiles(0.5)(foo), 1000)",
-            "mql_context": {
-                "start": "2023-01-02T03:04:05+00:00",
-                "end": "2023-01-16T03:04:05+00:00",
-                "rollup": {
-                    "orderby": None,
-                    "granularity": 3600,
-                    "interval": 3600,
-                    "with_totals": None,
-                },
-                "scope": {
-                    "org_ids": [1],
-                    "project_ids": [11],
-                    "use_case_id": "transactions",
-                },
-                "limit": 100,
-                "offset": 5,
-                "extrapolate": None,
-                "indexer_mappings": {},
-            },
+            "mql_context": build_context(limit=100, offset=5),
         },
         id="test arbitrary function with curried aggregate",
     ),
     pytest.param(
-        MetricsQuery(
+        lambda: build_query(
             query=Formula(
                 "apdex",
                 [
@@ -976,7 +505,7 @@ metrics_query_formula_to_mql_tests = [
                         function_name="failure_rate",
                         parameters=[
                             Timeseries(
-                                metric=Metric(public_name="foo"),
+                                metric=FOO_METRIC,
                                 aggregate="sum",
                             ),
                         ],
@@ -984,42 +513,17 @@ metrics_query_formula_to_mql_tests = [
                     1000,
                 ],
             ),
-            start=NOW,
-            end=NOW + timedelta(days=14),
-            rollup=Rollup(interval=3600, totals=None, granularity=3600),
-            scope=MetricsScope(
-                org_ids=[1], project_ids=[11], use_case_id="transactions"
-            ),
             limit=Limit(100),
             offset=Offset(5),
-            indexer_mappings={},
         ),
         {
             "mql": "apdex(failure_rate(sum(foo)), 1000)",
-            "mql_context": {
-                "start": "2023-01-02T03:04:05+00:00",
-                "end": "2023-01-16T03:04:05+00:00",
-                "rollup": {
-                    "orderby": None,
-                    "granularity": 3600,
-                    "interval": 3600,
-                    "with_totals": None,
-                },
-                "scope": {
-                    "org_ids": [1],
-                    "project_ids": [11],
-                    "use_case_id": "transactions",
-                },
-                "limit": 100,
-                "offset": 5,
-                "extrapolate": None,
-                "indexer_mappings": {},
-            },
+            "mql_context": build_context(limit=100, offset=5),
         },
         id="test nested arbitrary function",
     ),
     pytest.param(
-        MetricsQuery(
+        lambda: build_query(
             query=Formula(
                 function_name="apdex",
                 parameters=[
@@ -1027,11 +531,11 @@ metrics_query_formula_to_mql_tests = [
                         function_name=ArithmeticOperator.DIVIDE.value,
                         parameters=[
                             Timeseries(
-                                metric=Metric(public_name="foo"),
+                                metric=FOO_METRIC,
                                 aggregate="sum",
                             ),
                             Timeseries(
-                                metric=Metric(public_name="bar"),
+                                metric=BAR_METRIC,
                                 aggregate="sum",
                             ),
                         ],
@@ -1041,42 +545,17 @@ metrics_query_formula_to_mql_tests = [
                 filters=[Condition(Column("tag"), Op.EQ, "tag_value")],
                 groupby=[Column("transaction")],
             ),
-            start=NOW,
-            end=NOW + timedelta(days=14),
-            rollup=Rollup(interval=3600, totals=None, granularity=3600),
-            scope=MetricsScope(
-                org_ids=[1], project_ids=[11], use_case_id="transactions"
-            ),
             limit=Limit(100),
             offset=Offset(5),
-            indexer_mappings={},
         ),
         {
             "mql": 'apdex((sum(foo) / sum(bar)), 500){tag:"tag_value"} by (transaction)',
-            "mql_context": {
-                "start": "2023-01-02T03:04:05+00:00",
-                "end": "2023-01-16T03:04:05+00:00",
-                "rollup": {
-                    "orderby": None,
-                    "granularity": 3600,
-                    "interval": 3600,
-                    "with_totals": None,
-                },
-                "scope": {
-                    "org_ids": [1],
-                    "project_ids": [11],
-                    "use_case_id": "transactions",
-                },
-                "limit": 100,
-                "offset": 5,
-                "extrapolate": None,
-                "indexer_mappings": {},
-            },
+            "mql_context": build_context(limit=100, offset=5),
         },
         id="test arbitrary function with inner term",
     ),
     pytest.param(
-        MetricsQuery(
+        lambda: build_query(
             query=Formula(
                 function_name="topK",
                 aggregate_params=[10],
@@ -1085,53 +564,28 @@ metrics_query_formula_to_mql_tests = [
                         function_name="divide",
                         parameters=[
                             Timeseries(
-                                metric=Metric(public_name="transaction.duration"),
+                                metric=TXN_DURATION_METRIC,
                                 aggregate="sum",
                             ),
                             Timeseries(
-                                metric=Metric(public_name="transaction.duration"),
+                                metric=TXN_DURATION_METRIC,
                                 aggregate="count",
                             ),
                         ],
                     ),
                 ],
             ),
-            start=NOW,
-            end=NOW + timedelta(days=14),
-            rollup=Rollup(interval=3600, totals=None, granularity=3600),
-            scope=MetricsScope(
-                org_ids=[1], project_ids=[11], use_case_id="transactions"
-            ),
             limit=Limit(100),
             offset=Offset(5),
-            indexer_mappings={},
         ),
         {
             "mql": "topK(10)((sum(transaction.duration) / count(transaction.duration)))",
-            "mql_context": {
-                "start": "2023-01-02T03:04:05+00:00",
-                "end": "2023-01-16T03:04:05+00:00",
-                "rollup": {
-                    "orderby": None,
-                    "granularity": 3600,
-                    "interval": 3600,
-                    "with_totals": None,
-                },
-                "scope": {
-                    "org_ids": [1],
-                    "project_ids": [11],
-                    "use_case_id": "transactions",
-                },
-                "limit": 100,
-                "offset": 5,
-                "extrapolate": None,
-                "indexer_mappings": {},
-            },
+            "mql_context": build_context(limit=100, offset=5),
         },
         id="test curried arbitrary function with inner aggregate and terms",
     ),
     pytest.param(
-        MetricsQuery(
+        lambda: build_query(
             query=Formula(
                 function_name="topK",
                 aggregate_params=[10],
@@ -1140,7 +594,7 @@ metrics_query_formula_to_mql_tests = [
                         function_name="apdex",
                         parameters=[
                             Timeseries(
-                                metric=Metric(public_name="transaction.duration"),
+                                metric=TXN_DURATION_METRIC,
                                 aggregate="sum",
                             ),
                             500,
@@ -1149,84 +603,34 @@ metrics_query_formula_to_mql_tests = [
                     ),
                 ],
             ),
-            start=NOW,
-            end=NOW + timedelta(days=14),
-            rollup=Rollup(interval=3600, totals=None, granularity=3600),
-            scope=MetricsScope(
-                org_ids=[1], project_ids=[11], use_case_id="transactions"
-            ),
             limit=Limit(100),
             offset=Offset(5),
-            indexer_mappings={},
         ),
         {
             "mql": 'topK(10)(apdex(sum(transaction.duration), 500){bar:"baz"})',
-            "mql_context": {
-                "start": "2023-01-02T03:04:05+00:00",
-                "end": "2023-01-16T03:04:05+00:00",
-                "rollup": {
-                    "orderby": None,
-                    "granularity": 3600,
-                    "interval": 3600,
-                    "with_totals": None,
-                },
-                "scope": {
-                    "org_ids": [1],
-                    "project_ids": [11],
-                    "use_case_id": "transactions",
-                },
-                "limit": 100,
-                "offset": 5,
-                "extrapolate": None,
-                "indexer_mappings": {},
-            },
+            "mql_context": build_context(limit=100, offset=5),
         },
         id="test curried arbitrary function with inner arbitrary function",
     ),
     pytest.param(
-        MetricsQuery(
+        lambda: build_query(
             query="((sum(transaction.duration{transaction:t1}) / sum(transaction.duration)){transaction:t2} + sum(transaction.duration){transaction:t3}) by transaction",
-            start=NOW,
-            end=NOW + timedelta(days=14),
-            rollup=Rollup(interval=3600, totals=None, granularity=3600),
-            scope=MetricsScope(
-                org_ids=[1], project_ids=[11], use_case_id="transactions"
-            ),
             limit=Limit(100),
             offset=Offset(5),
-            indexer_mappings={},
         ),
         {
             "mql": '((sum(transaction.duration){transaction:"t1"} / sum(transaction.duration)){transaction:"t2"} + sum(transaction.duration){transaction:"t3"}) by (transaction)',
-            "mql_context": {
-                "start": "2023-01-02T03:04:05+00:00",
-                "end": "2023-01-16T03:04:05+00:00",
-                "rollup": {
-                    "orderby": None,
-                    "granularity": 3600,
-                    "interval": 3600,
-                    "with_totals": None,
-                },
-                "scope": {
-                    "org_ids": [1],
-                    "project_ids": [11],
-                    "use_case_id": "transactions",
-                },
-                "limit": 100,
-                "offset": 5,
-                "extrapolate": None,
-                "indexer_mappings": {},
-            },
+            "mql_context": build_context(limit=100, offset=5),
         },
-        id="test curried arbitrary function with inner arbitrary function",
+        id="test formula string with nested filters",
     ),
     pytest.param(
-        MetricsQuery(
+        lambda: build_query(
             query=Formula(
                 ArithmeticOperator.DIVIDE.value,
                 [
                     Timeseries(
-                        metric=Metric(public_name="foo"),
+                        metric=FOO_METRIC,
                         aggregate="sum",
                     ),
                     1000,
@@ -1242,50 +646,52 @@ metrics_query_formula_to_mql_tests = [
                     )
                 ],
             ),
-            start=NOW,
-            end=NOW + timedelta(days=14),
-            rollup=Rollup(interval=3600, totals=None, granularity=3600),
-            scope=MetricsScope(
-                org_ids=[1], project_ids=[11], use_case_id="transactions"
-            ),
             limit=Limit(100),
             offset=Offset(5),
-            indexer_mappings={},
         ),
         {
             "mql": '(sum(foo) / 1000){transaction:["a", "b", "c"]}',
-            "mql_context": {
-                "start": "2023-01-02T03:04:05+00:00",
-                "end": "2023-01-16T03:04:05+00:00",
-                "rollup": {
-                    "orderby": None,
-                    "granularity": 3600,
-                    "interval": 3600,
-                    "with_totals": None,
-                },
-                "scope": {
-                    "org_ids": [1],
-                    "project_ids": [11],
-                    "use_case_id": "transactions",
-                },
-                "limit": 100,
-                "offset": 5,
-                "extrapolate": None,
-                "indexer_mappings": {},
-            },
+            "mql_context": build_context(limit=100, offset=5),
         },
         id="test_or_optimized",
     ),
 ]
 
 
-@pytest.mark.parametrize("query, translated", metrics_query_formula_to_mql_tests)
-def test_metrics_query_to_mql_formula(
-    query: MetricsQuery, translated: dict[str, Any]
+metrics_query_to_mql_tests = (
+    metrics_query_timeseries_to_mql_tests + metrics_query_formula_to_mql_tests
+)
+
+
+@pytest.mark.parametrize(
+    "query_factory",
+    [
+        pytest.param(param.values[0], id=param.id)
+        for param in metrics_query_to_mql_tests
+    ],
+)
+def test_metrics_query_validate(query_factory: Callable[[], MetricsQuery]) -> None:
+    query_factory().validate()
+
+
+@pytest.mark.parametrize("query_factory, translated", metrics_query_to_mql_tests)
+def test_metrics_query_to_mql(
+    query_factory: Callable[[], MetricsQuery], translated: dict[str, Any]
 ) -> None:
-    query.validate()
-    serialized = query.serialize()
+    serialized = query_factory().serialize()
     assert isinstance(serialized, dict)
     assert serialized["mql"] == translated["mql"]
     assert serialized["mql_context"] == translated["mql_context"]
-    assert parse_mql(str(serialized["mql"])) is not None
+
+
+# The serializer tests above check the MQL output against these literals, so parsing
+# each unique literal once is enough to ensure we can parse our own encoding.
+UNIQUE_MQLS: frozenset[str] = frozenset(
+    str(param.values[1]["mql"])  # type: ignore[index]
+    for param in metrics_query_to_mql_tests
+)
+
+
+@pytest.mark.parametrize("mql", sorted(UNIQUE_MQLS))
+def test_mql_parses(mql: str) -> None:
+    assert parse_mql(mql) is not None
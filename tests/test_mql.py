@@ -1,5 +1,7 @@
 from __future__ import annotations
 
+from typing import Callable
+
 import pytest
 
 from snuba_sdk.column import Column
@@ -8,10 +10,26 @@ from snuba_sdk.formula import ArithmeticOperator, Formula
 from snuba_sdk.mql.mql import parse_mql
 from snuba_sdk.timeseries import Metric, Timeseries
 
+# Leaves that recur in the expected parse results. Metric and Condition are immutable,
+# so the lazily built expected trees can all point at the same instances.
+TXN_DURATION_MRI_METRIC = Metric(mri="d:transactions/duration@millisecond")
+PAGE_CLICK_MRI_METRIC = Metric(mri="c:custom/page_click@none")
+APP_LOAD_MRI_METRIC = Metric(mri="d:custom/app_load@millisecond")
+ZONE_DOMAINS_MRI_METRIC = Metric(mri="g:custom/zone.domains@none")
+TXN_DURATION_METRIC = Metric(public_name="transaction.duration")
+FOO_METRIC = Metric(public_name="foo")
+BAR_METRIC = Metric(public_name="bar")
+USER_METRIC = Metric(public_name="user")
+
+BAR_EQ_BAZ = Condition(Column("bar"), Op.EQ, "baz")
+FOO_EQ_FOZ = Condition(Column("foo"), Op.EQ, "foz")
+TAG_EQ_TAG_VALUE = Condition(Column("tag"), Op.EQ, "tag_value")
+HEE_EQ_HAW = Condition(Column("hee"), Op.EQ, "haw")
+
 base_tests = [
     pytest.param(
         "sum(`d:transactions/Duration.Metric@{millisecond}`)",
-        Timeseries(
+        lambda: Timeseries(
             metric=Metric(mri="d:transactions/Duration.Metric@{millisecond}"),
             aggregate="sum",
         ),
@@ -19,7 +37,7 @@ base_tests = [
     ),
     pytest.param(
         "sum(d:transactions/organizations.api.v1@millisecond)",
-        Timeseries(
+        lambda: Timeseries(
             metric=Metric(mri="d:transactions/organizations.api.v1@millisecond"),
             aggregate="sum",
         ),
@@ -27,7 +45,7 @@ base_tests = [
     ),
     pytest.param(
         "sum(`avg(d:transactions/Duration.Metric@{millisecond})`)",
-        Timeseries(
+        lambda: Timeseries(
             metric=Metric(mri="avg(d:transactions/Duration.Metric@{millisecond})"),
             aggregate="sum",
         ),
@@ -35,64 +53,68 @@ base_tests = [
     ),
     pytest.param(
         "sum(`transactions.duration`)",
-        Timeseries(metric=Metric(public_name="transactions.duration"), aggregate="sum"),
+        lambda: Timeseries(
+            metric=Metric(public_name="transactions.duration"), aggregate="sum"
+        ),
         id="test quoted public name 1",
     ),
     pytest.param(
         "sum(`foo`)",
-        Timeseries(metric=Metric(public_name="foo"), aggregate="sum"),
+        lambda: Timeseries(metric=FOO_METRIC, aggregate="sum"),
         id="test quoted public name 2",
     ),
     pytest.param(
         "sum(transactions.duration)",
-        Timeseries(metric=Metric(public_name="transactions.duration"), aggregate="sum"),
+        lambda: Timeseries(
+            metric=Metric(public_name="transactions.duration"), aggregate="sum"
+        ),
         id="test unquoted public name 1",
     ),
     pytest.param(
         "sum(foo)",
-        Timeseries(metric=Metric(public_name="foo"), aggregate="sum"),
-        id="test unquoted public name 1",
+        lambda: Timeseries(metric=FOO_METRIC, aggregate="sum"),
+        id="test unquoted public name 2",
     ),
     pytest.param(
         "(sum(foo))",
-        Timeseries(metric=Metric(public_name="foo"), aggregate="sum"),
+        lambda: Timeseries(metric=FOO_METRIC, aggregate="sum"),
         id="test nested expressions 1",
     ),
     pytest.param(
-        "(sum(foo))",
-        Timeseries(metric=Metric(public_name="foo"), aggregate="sum"),
+        "((sum(foo)))",
+        lambda: Timeseries(metric=FOO_METRIC, aggregate="sum"),
         id="test nested expressions 2",
     ),
     pytest.param(
         'sum(foo){bar:"baz"}',
-        Timeseries(
-            metric=Metric(public_name="foo"),
+        lambda: Timeseries(
+            metric=FOO_METRIC,
             aggregate="sum",
-            filters=[Condition(Column("bar"), Op.EQ, "baz")],
+            filters=[BAR_EQ_BAZ],
         ),
         id="test filter",
     ),
     pytest.param(
         "sum(foo){}",
-        Timeseries(
-            metric=Metric(public_name="foo"),
+        lambda: Timeseries(
+            metric=FOO_METRIC,
             aggregate="sum",
         ),
         id="test empty filter",
     ),
     pytest.param(
         "sum(foo){bar:baz}",
-        Timeseries(
-            metric=Metric(public_name="foo"),
+        lambda: Timeseries(
+            metric=FOO_METRIC,
             aggregate="sum",
-            filters=[Condition(Column("bar"), Op.EQ, "baz")],
+            filters=[BAR_EQ_BAZ],
         ),
         id="test filter with unquoted value",
     ),
     pytest.param(
         'sum(foo){bar:"2023-01-03T10:00:00"}',
-        Timeseries(
-            metric=Metric(public_name="foo"),
+        lambda: Timeseries(
+            metric=FOO_METRIC,
             aggregate="sum",
             filters=[Condition(Column("bar"), Op.EQ, "2023-01-03T10:00:00")],
         ),
@@ -100,8 +122,8 @@ base_tests = [
     ),
     pytest.param(
         "sum(foo){bar:2023-01-03T10:00:00}",
-        Timeseries(
-            metric=Metric(public_name="foo"),
+        lambda: Timeseries(
+            metric=FOO_METRIC,
             aggregate="sum",
             filters=[Condition(Column("bar"), Op.EQ, "2023-01-03T10:00:00")],
         ),
@@ -109,8 +131,8 @@ base_tests = [
     ),
     pytest.param(
         'sum(foo){!bar:"baz"}',
-        Timeseries(
-            metric=Metric(public_name="foo"),
+        lambda: Timeseries(
+            metric=FOO_METRIC,
             aggregate="sum",
             filters=[Condition(Column("bar"), Op.NEQ, "baz")],
         ),
@@ -118,8 +140,8 @@ base_tests = [
     ),
     pytest.param(
         "sum(foo){!bar:baz}",
-        Timeseries(
-            metric=Metric(public_name="foo"),
+        lambda: Timeseries(
+            metric=FOO_METRIC,
             aggregate="sum",
             filters=[Condition(Column("bar"), Op.NEQ, "baz")],
         ),
@@ -127,8 +149,8 @@ base_tests = [
     ),
     pytest.param(
         'sum(foo){bar:["baz", "bap"]}',
-        Timeseries(
-            metric=Metric(public_name="foo"),
+        lambda: Timeseries(
+            metric=FOO_METRIC,
             aggregate="sum",
             filters=[Condition(Column("bar"), Op.IN, ["baz", "bap"])],
         ),
@@ -136,8 +158,8 @@ base_tests = [
     ),
     pytest.param(
         'sum(foo){bar:["baz", bap]}',
-        Timeseries(
-            metric=Metric(public_name="foo"),
+        lambda: Timeseries(
+            metric=FOO_METRIC,
             aggregate="sum",
             filters=[Condition(Column("bar"), Op.IN, ["baz", "bap"])],
         ),
@@ -145,8 +167,8 @@ base_tests = [
     ),
     pytest.param(
         "sum(foo){bar:[baz, bap]}",
-        Timeseries(
-            metric=Metric(public_name="foo"),
+        lambda: Timeseries(
+            metric=FOO_METRIC,
             aggregate="sum",
             filters=[Condition(Column("bar"), Op.IN, ["baz", "bap"])],
         ),
@@ -154,8 +176,8 @@ base_tests = [
     ),
     pytest.param(
         'sum(foo){!bar:["baz", "bap"]}',
-        Timeseries(
-            metric=Metric(public_name="foo"),
+        lambda: Timeseries(
+            metric=FOO_METRIC,
             aggregate="sum",
             filters=[Condition(Column("bar"), Op.NOT_IN, ["baz", "bap"])],
         ),
@@ -163,8 +185,8 @@ base_tests = [
     ),
     pytest.param(
         "sum(foo){!bar:[baz, bap]}",
-        Timeseries(
-            metric=Metric(public_name="foo"),
+        lambda: Timeseries(
+            metric=FOO_METRIC,
             aggregate="sum",
             filters=[Condition(Column("bar"), Op.NOT_IN, ["baz", "bap"])],
         ),
@@ -172,8 +194,8 @@ base_tests = [
     ),
     pytest.param(
         'sum(foo){!bar:["baz", bap]}',
-        Timeseries(
-            metric=Metric(public_name="foo"),
+        lambda: Timeseries(
+            metric=FOO_METRIC,
             aggregate="sum",
             filters=[Condition(Column("bar"), Op.NOT_IN, ["baz", "bap"])],
         ),
@@ -181,26 +203,26 @@ base_tests = [
     ),
     pytest.param(
         'sum(foo{bar:"baz"})',
-        Timeseries(
-            metric=Metric(public_name="foo"),
+        lambda: Timeseries(
+            metric=FOO_METRIC,
             aggregate="sum",
-            filters=[Condition(Column("bar"), Op.EQ, "baz")],
+            filters=[BAR_EQ_BAZ],
         ),
         id="test filter inside aggregate",
     ),
     pytest.param(
         "sum(foo{bar:baz})",
-        Timeseries(
-            metric=Metric(public_name="foo"),
+        lambda: Timeseries(
+            metric=FOO_METRIC,
             aggregate="sum",
-            filters=[Condition(Column("bar"), Op.EQ, "baz")],
+            filters=[BAR_EQ_BAZ],
         ),
         id="test filter inside aggregate with unquoted value",
     ),
     pytest.param(
         "sum(foo){bar:before_wildcard_*}",
-        Timeseries(
-            metric=Metric(public_name="foo"),
+        lambda: Timeseries(
+            metric=FOO_METRIC,
             aggregate="sum",
             filters=[Condition(Column("bar"), Op.LIKE, "before_wildcard_*")],
         ),
@@ -208,8 +230,8 @@ base_tests = [
     ),
     pytest.param(
         'sum(foo){bar:before_wildcard_* and foo:"before_other_wildcard_*"}',
-        Timeseries(
-            metric=Metric(public_name="foo"),
+        lambda: Timeseries(
+            metric=FOO_METRIC,
             aggregate="sum",
             filters=[
                 And(
@@ -224,8 +246,8 @@ base_tests = [
     ),
     pytest.param(
         'sum(foo){bar:"before_wildcard_*"}',
-        Timeseries(
-            metric=Metric(public_name="foo"),
+        lambda: Timeseries(
+            metric=FOO_METRIC,
             aggregate="sum",
             filters=[Condition(Column("bar"), Op.LIKE, "before_wildcard_*")],
         ),
@@ -233,8 +255,8 @@ base_tests = [
     ),
     pytest.param(
         'sum(foo){bar:"before_wildcard_*" and foo:"before_other_wildcard_*"}',
-        Timeseries(
-            metric=Metric(public_name="foo"),
+        lambda: Timeseries(
+            metric=FOO_METRIC,
             aggregate="sum",
             filters=[
                 And(
@@ -249,8 +271,8 @@ base_tests = [
     ),
     pytest.param(
         'sum(foo){bar:"before_wildcard_*" and foo:"before_other_wildcard_*" and baz:hello and !barbaz:foo}',
-        Timeseries(
-            metric=Metric(public_name="foo"),
+        lambda: Timeseries(
+            metric=FOO_METRIC,
             aggregate="sum",
             filters=[
                 And(
@@ -267,8 +289,8 @@ base_tests = [
     ),
     pytest.param(
         'sum(foo){bar:"*_after_wildcard"}',
-        Timeseries(
-            metric=Metric(public_name="foo"),
+        lambda: Timeseries(
+            metric=FOO_METRIC,
             aggregate="sum",
             filters=[Condition(Column("bar"), Op.EQ, "*_after_wildcard")],
         ),
@@ -276,8 +298,8 @@ base_tests = [
     ),
     pytest.param(
         'sum(foo){!bar:"before_wildcard_*"}',
-        Timeseries(
-            metric=Metric(public_name="foo"),
+        lambda: Timeseries(
+            metric=FOO_METRIC,
             aggregate="sum",
             filters=[Condition(Column("bar"), Op.NOT_LIKE, "before_wildcard_*")],
         ),
@@ -285,14 +307,14 @@ base_tests = [
     ),
     pytest.param(
         'sum(user{bar:"baz", foo:"foz"})',
-        Timeseries(
-            metric=Metric(public_name="user"),
+        lambda: Timeseries(
+            metric=USER_METRIC,
             aggregate="sum",
             filters=[
                 And(
                     conditions=[
-                        Condition(Column("bar"), Op.EQ, "baz"),
-                        Condition(Column("foo"), Op.EQ, "foz"),
+                        BAR_EQ_BAZ,
+                        FOO_EQ_FOZ,
                     ],
                 )
             ],
@@ -301,14 +323,14 @@ base_tests = [
     ),
     pytest.param(
         'sum(user{bar:"baz" foo:"foz"})',
-        Timeseries(
-            metric=Metric(public_name="user"),
+        lambda: Timeseries(
+            metric=USER_METRIC,
             aggregate="sum",
             filters=[
                 And(
                     conditions=[
-                        Condition(Column("bar"), Op.EQ, "baz"),
-                        Condition(Column("foo"), Op.EQ, "foz"),
+                        BAR_EQ_BAZ,
+                        FOO_EQ_FOZ,
                     ]
                 )
             ],
@@ -317,14 +339,14 @@ base_tests = [
     ),
     pytest.param(
         'sum(user{bar:"baz" and foo:"foz"})',
-        Timeseries(
-            metric=Metric(public_name="user"),
+        lambda: Timeseries(
+            metric=USER_METRIC,
             aggregate="sum",
             filters=[
                 And(
                     conditions=[
-                        Condition(Column("bar"), Op.EQ, "baz"),
-                        Condition(Column("foo"), Op.EQ, "foz"),
+                        BAR_EQ_BAZ,
+                        FOO_EQ_FOZ,
                     ]
                 )
             ],
@@ -333,17 +355,17 @@ base_tests = [
     ),
     pytest.param(
         'sum(user{bar:"baz" OR foo:"foz" and (hee:"haw")})',
-        Timeseries(
-            metric=Metric(public_name="user"),
+        lambda: Timeseries(
+            metric=USER_METRIC,
             aggregate="sum",
             filters=[
                 Or(
                     conditions=[
-                        Condition(Column("bar"), Op.EQ, "baz"),
+                        BAR_EQ_BAZ,
                         And(
                             conditions=[
-                                Condition(Column("foo"), Op.EQ, "foz"),
-                                Condition(Column("hee"), Op.EQ, "haw"),
+                                FOO_EQ_FOZ,
+                                HEE_EQ_HAW,
                             ]
                         ),
                     ],
@@ -354,19 +376,19 @@ base_tests = [
     ),
     pytest.param(
         'sum(user{(bar:"baz" or foo:"foz") AND hee:"haw"})',
-        Timeseries(
-            metric=Metric(public_name="user"),
+        lambda: Timeseries(
+            metric=USER_METRIC,
             aggregate="sum",
             filters=[
                 And(
                     conditions=[
                         Or(
                             conditions=[
-                                Condition(Column("bar"), Op.EQ, "baz"),
-                                Condition(Column("foo"), Op.EQ, "foz"),
+                                BAR_EQ_BAZ,
+                                FOO_EQ_FOZ,
                             ],
                         ),
-                        Condition(Column("hee"), Op.EQ, "haw"),
+                        HEE_EQ_HAW,
                     ]
                 )
             ],
@@ -375,15 +397,15 @@ base_tests = [
     ),
     pytest.param(
         'sum(user{bar:"baz" foo:"foz", hee:"haw" AND key:"value"})',
-        Timeseries(
-            metric=Metric(public_name="user"),
+        lambda: Timeseries(
+            metric=USER_METRIC,
             aggregate="sum",
             filters=[
                 And(
                     conditions=[
-                        Condition(Column("bar"), Op.EQ, "baz"),
-                        Condition(Column("foo"), Op.EQ, "foz"),
-                        Condition(Column("hee"), Op.EQ, "haw"),
+                        BAR_EQ_BAZ,
+                        FOO_EQ_FOZ,
+                        HEE_EQ_HAW,
                         Condition(Column("key"), Op.EQ, "value"),
                     ]
                 )
@@ -393,14 +415,14 @@ base_tests = [
     ),
     pytest.param(
         "sum(user{bar:baz, foo:foz})",
-        Timeseries(
-            metric=Metric(public_name="user"),
+        lambda: Timeseries(
+            metric=USER_METRIC,
             aggregate="sum",
             filters=[
                 And(
                     conditions=[
-                        Condition(Column("bar"), Op.EQ, "baz"),
-                        Condition(Column("foo"), Op.EQ, "foz"),
+                        BAR_EQ_BAZ,
+                        FOO_EQ_FOZ,
                     ]
                 )
             ],
@@ -409,14 +431,14 @@ base_tests = [
     ),
     pytest.param(
         "sum(user{bar:baz foo:foz})",
-        Timeseries(
-            metric=Metric(public_name="user"),
+        lambda: Timeseries(
+            metric=USER_METRIC,
             aggregate="sum",
             filters=[
                 And(
                     conditions=[
-                        Condition(Column("bar"), Op.EQ, "baz"),
-                        Condition(Column("foo"), Op.EQ, "foz"),
+                        BAR_EQ_BAZ,
+                        FOO_EQ_FOZ,
                     ]
                 )
             ],
@@ -425,15 +447,15 @@ base_tests = [
     ),
     pytest.param(
         "sum(user{bar:baz foo:foz, hee:haw})",
-        Timeseries(
-            metric=Metric(public_name="user"),
+        lambda: Timeseries(
+            metric=USER_METRIC,
             aggregate="sum",
             filters=[
                 And(
                     conditions=[
-                        Condition(Column("bar"), Op.EQ, "baz"),
-                        Condition(Column("foo"), Op.EQ, "foz"),
-                        Condition(Column("hee"), Op.EQ, "haw"),
+                        BAR_EQ_BAZ,
+                        FOO_EQ_FOZ,
+                        HEE_EQ_HAW,
                     ]
                 )
             ],
@@ -442,14 +464,14 @@ base_tests = [
     ),
     pytest.param(
         'sum(user{bar:"baz", foo:foz})',
-        Timeseries(
-            metric=Metric(public_name="user"),
+        lambda: Timeseries(
+            metric=USER_METRIC,
             aggregate="sum",
             filters=[
                 And(
                     conditions=[
-                        Condition(Column("bar"), Op.EQ, "baz"),
-                        Condition(Column("foo"), Op.EQ, "foz"),
+                        BAR_EQ_BAZ,
+                        FOO_EQ_FOZ,
                     ]
                 )
             ],
@@ -458,14 +480,14 @@ base_tests = [
     ),
     pytest.param(
         'sum(user{bar:"baz" foo:foz})',
-        Timeseries(
-            metric=Metric(public_name="user"),
+        lambda: Timeseries(
+            metric=USER_METRIC,
             aggregate="sum",
             filters=[
                 And(
                     conditions=[
-                        Condition(Column("bar"), Op.EQ, "baz"),
-                        Condition(Column("foo"), Op.EQ, "foz"),
+                        BAR_EQ_BAZ,
+                        FOO_EQ_FOZ,
                     ]
                 )
             ],
@@ -474,15 +496,15 @@ base_tests = [
     ),
     pytest.param(
         'sum(user{bar:"baz" foo:foz, hee:"haw"})',
-        Timeseries(
-            metric=Metric(public_name="user"),
+        lambda: Timeseries(
+            metric=USER_METRIC,
             aggregate="sum",
             filters=[
                 And(
                     conditions=[
-                        Condition(Column("bar"), Op.EQ, "baz"),
-                        Condition(Column("foo"), Op.EQ, "foz"),
-                        Condition(Column("hee"), Op.EQ, "haw"),
+                        BAR_EQ_BAZ,
+                        FOO_EQ_FOZ,
+                        HEE_EQ_HAW,
                     ]
                 )
             ],
@@ -491,14 +513,14 @@ base_tests = [
     ),
     pytest.param(
         'sum(user{bar:baz foo:"foz", !hee:["haw", hoo]})',
-        Timeseries(
-            metric=Metric(public_name="user"),
+        lambda: Timeseries(
+            metric=USER_METRIC,
             aggregate="sum",
             filters=[
                 And(
                     conditions=[
-                        Condition(Column("bar"), Op.EQ, "baz"),
-                        Condition(Column("foo"), Op.EQ, "foz"),
+                        BAR_EQ_BAZ,
+                        FOO_EQ_FOZ,
                         Condition(Column("hee"), Op.NOT_IN, ["haw", "hoo"]),
                     ]
                 )
@@ -508,15 +530,15 @@ base_tests = [
     ),
     pytest.param(
         'sum(`d:transactions/duration@millisecond`{foo:"foz", hee:"haw"}){bar:"baz"}',
-        Timeseries(
-            metric=Metric(mri="d:transactions/duration@millisecond"),
+        lambda: Timeseries(
+            metric=TXN_DURATION_MRI_METRIC,
             aggregate="sum",
             filters=[
-                Condition(Column("bar"), Op.EQ, "baz"),
+                BAR_EQ_BAZ,
                 And(
                     conditions=[
-                        Condition(Column("foo"), Op.EQ, "foz"),
-                        Condition(Column("hee"), Op.EQ, "haw"),
+                        FOO_EQ_FOZ,
+                        HEE_EQ_HAW,
                     ]
                 ),
             ],
@@ -525,18 +547,18 @@ base_tests = [
     ),
     pytest.param(
         'max(`d:transactions/duration@millisecond`{foo:"foz"}) by transaction',
-        Timeseries(
-            metric=Metric(mri="d:transactions/duration@millisecond"),
+        lambda: Timeseries(
+            metric=TXN_DURATION_MRI_METRIC,
             aggregate="max",
-            filters=[Condition(Column("foo"), Op.EQ, "foz")],
+            filters=[FOO_EQ_FOZ],
             groupby=[Column("transaction")],
         ),
         id="test group by 1",
     ),
     pytest.param(
         "max(`d:transactions/duration@millisecond`{transaction.status:foz} by http.status_code)",
-        Timeseries(
-            metric=Metric(mri="d:transactions/duration@millisecond"),
+        lambda: Timeseries(
+            metric=TXN_DURATION_MRI_METRIC,
             aggregate="max",
             filters=[Condition(Column("transaction.status"), Op.EQ, "foz")],
             groupby=[Column("http.status_code")],
@@ -545,8 +567,8 @@ base_tests = [
     ),
     pytest.param(
         'max(`d:transactions/duration@millisecond`{transaction.status:"foz"}) by (transaction)',
-        Timeseries(
-            metric=Metric(mri="d:transactions/duration@millisecond"),
+        lambda: Timeseries(
+            metric=TXN_DURATION_MRI_METRIC,
             aggregate="max",
             filters=[Condition(Column("transaction.status"), Op.EQ, "foz")],
             groupby=[Column("transaction")],
@@ -555,8 +577,8 @@ base_tests = [
     ),
     pytest.param(
         'max(`d:transactions/duration@millisecond`{transaction.status:"foz"}){transaction.op:baz} by (a.something, b.something)',
-        Timeseries(
-            metric=Metric(mri="d:transactions/duration@millisecond"),
+        lambda: Timeseries(
+            metric=TXN_DURATION_MRI_METRIC,
             aggregate="max",
             filters=[
                 Condition(Column("transaction.op"), Op.EQ, "baz"),
@@ -568,16 +590,16 @@ base_tests = [
     ),
     pytest.param(
         "p90(`d:transactions/duration@millisecond`)",
-        Timeseries(
-            metric=Metric(mri="d:transactions/duration@millisecond"),
+        lambda: Timeseries(
+            metric=TXN_DURATION_MRI_METRIC,
             aggregate="p90",
         ),
         id="test percentile function",
     ),
     pytest.param(
         "quantiles(0.5)(`d:transactions/duration@millisecond`)",
-        Timeseries(
-            metric=Metric(mri="d:transactions/duration@millisecond"),
+        lambda: Timeseries(
+            metric=TXN_DURATION_MRI_METRIC,
             aggregate="quantiles",
             aggregate_params=[0.5],
         ),
@@ -585,8 +607,8 @@ base_tests = [
     ),
     pytest.param(
         "quantiles(0.5, 0.95)(`d:transactions/duration@millisecond`)",
-        Timeseries(
-            metric=Metric(mri="d:transactions/duration@millisecond"),
+        lambda: Timeseries(
+            metric=TXN_DURATION_MRI_METRIC,
             aggregate="quantiles",
             aggregate_params=[0.5, 0.95],
         ),
@@ -594,8 +616,8 @@ base_tests = [
     ),
     pytest.param(
         "quantiles()(`d:transactions/duration@millisecond`)",
-        Timeseries(
-            metric=Metric(mri="d:transactions/duration@millisecond"),
+        lambda: Timeseries(
+            metric=TXN_DURATION_MRI_METRIC,
             aggregate="quantiles",
             aggregate_params=[],
         ),
@@ -603,8 +625,8 @@ base_tests = [
     ),
     pytest.param(
         'quantiles(0.5, "random", other, 9)(`d:transactions/duration@millisecond`)',
-        Timeseries(
-            metric=Metric(mri="d:transactions/duration@millisecond"),
+        lambda: Timeseries(
+            metric=TXN_DURATION_MRI_METRIC,
             aggregate="quantiles",
             aggregate_params=[0.5, "random", "other", 9],
         ),
@@ -612,7 +634,7 @@ base_tests = [
     ),
     pytest.param(
         "quantiles(0.5)(`d:transactions/duration.1@millisecond`{})",
-        Timeseries(
+        lambda: Timeseries(
             metric=Metric(mri="d:transactions/duration.1@millisecond"),
             aggregate="quantiles",
             aggregate_params=[0.5],
@@ -621,13 +643,13 @@ base_tests = [
     ),
     pytest.param(
         'quantiles(0.5)(`d:transactions/duration_2@millisecond`{foo:"foz"}){bar:baz} by (a, b)',
-        Timeseries(
+        lambda: Timeseries(
             metric=Metric(mri="d:transactions/duration_2@millisecond"),
             aggregate="quantiles",
             aggregate_params=[0.5],
             filters=[
-                Condition(Column("bar"), Op.EQ, "baz"),
-                Condition(Column("foo"), Op.EQ, "foz"),
+                BAR_EQ_BAZ,
+                FOO_EQ_FOZ,
             ],
             groupby=[Column("a"), Column("b")],
         ),
@@ -635,12 +657,12 @@ base_tests = [
     ),
     pytest.param(
         "quantiles(0.5)(`d:transactions/duration@millisecond`{foo:'foz' AND hee:\"hoo\"}){bar:baz} by (a, b)",
-        Timeseries(
-            metric=Metric(mri="d:transactions/duration@millisecond"),
+        lambda: Timeseries(
+            metric=TXN_DURATION_MRI_METRIC,
             aggregate="quantiles",
             aggregate_params=[0.5],
             filters=[
-                Condition(Column("bar"), Op.EQ, "baz"),
+                BAR_EQ_BAZ,
                 And(
                     [
                         Condition(Column("foo"), Op.EQ, "'foz'"),
@@ -654,8 +676,8 @@ base_tests = [
     ),
     pytest.param(
         'max(d:transactions/duration@millisecond){bar:" !\\"#$%&\'()*+,-./0123456789:;<=>?@ABCDEFGHIJKLMNOPQRSTUVWXYZ[\\\\]^_`abcdefghijklmnopqrstuvwxyz{|}~"} by (transaction)',
-        Timeseries(
-            metric=Metric(mri="d:transactions/duration@millisecond"),
+        lambda: Timeseries(
+            metric=TXN_DURATION_MRI_METRIC,
             aggregate="max",
             filters=[
                 Condition(
@@ -671,20 +693,14 @@ base_tests = [
 ]
 
 
-@pytest.mark.parametrize("mql_string, metrics_query", base_tests)
-def test_parse_mql_base(mql_string: str, metrics_query: Formula | Timeseries) -> None:
-    result = parse_mql(mql_string)
-    assert result == metrics_query
-
-
 term_tests = [
     pytest.param(
         "sum(foo) / 1000",
-        Formula(
+        lambda: Formula(
             ArithmeticOperator.DIVIDE.value,
             [
                 Timeseries(
-                    metric=Metric(public_name="foo"),
+                    metric=FOO_METRIC,
                     aggregate="sum",
                 ),
                 1000.0,
@@ -694,15 +710,15 @@ term_tests = [
     ),
     pytest.param(
         "sum(foo) * max(bar)",
-        Formula(
+        lambda: Formula(
             ArithmeticOperator.MULTIPLY.value,
             [
                 Timeseries(
-                    metric=Metric(public_name="foo"),
+                    metric=FOO_METRIC,
                     aggregate="sum",
                 ),
                 Timeseries(
-                    metric=Metric(public_name="bar"),
+                    metric=BAR_METRIC,
                     aggregate="max",
                 ),
             ],
@@ -711,18 +727,18 @@ term_tests = [
     ),
     pytest.param(
         "(sum(foo) * sum(bar)) / 1000",
-        Formula(
+        lambda: Formula(
             ArithmeticOperator.DIVIDE.value,
             [
                 Formula(
                     ArithmeticOperator.MULTIPLY.value,
                     [
                         Timeseries(
-                            metric=Metric(public_name="foo"),
+                            metric=FOO_METRIC,
                             aggregate="sum",
                         ),
                         Timeseries(
-                            metric=Metric(public_name="bar"),
+                            metric=BAR_METRIC,
                             aggregate="sum",
                         ),
                     ],
@@ -734,36 +750,36 @@ term_tests = [
     ),
     pytest.param(
         '(sum(foo) / sum(bar)){tag:"tag_value"}',
-        Formula(
+        lambda: Formula(
             ArithmeticOperator.DIVIDE.value,
             [
                 Timeseries(
-                    metric=Metric(public_name="foo"),
+                    metric=FOO_METRIC,
                     aggregate="sum",
                 ),
                 Timeseries(
-                    metric=Metric(public_name="bar"),
+                    metric=BAR_METRIC,
                     aggregate="sum",
                 ),
             ],
-            filters=[Condition(Column("tag"), Op.EQ, "tag_value")],
+            filters=[TAG_EQ_TAG_VALUE],
         ),
         id="test terms with one filter",
     ),
     pytest.param(
         'sum(foo{tag:"tag_value"}) / sum(bar{tag:"tag_value"})',
-        Formula(
+        lambda: Formula(
             ArithmeticOperator.DIVIDE.value,
             [
                 Timeseries(
-                    metric=Metric(public_name="foo"),
+                    metric=FOO_METRIC,
                     aggregate="sum",
-                    filters=[Condition(Column("tag"), Op.EQ, "tag_value")],
+                    filters=[TAG_EQ_TAG_VALUE],
                 ),
                 Timeseries(
-                    metric=Metric(public_name="bar"),
+                    metric=BAR_METRIC,
                     aggregate="sum",
-                    filters=[Condition(Column("tag"), Op.EQ, "tag_value")],
+                    filters=[TAG_EQ_TAG_VALUE],
                 ),
             ],
         ),
@@ -771,35 +787,35 @@ term_tests = [
     ),
     pytest.param(
         '(sum(foo) / sum(bar)){tag:"tag_value"} by transaction',
-        Formula(
+        lambda: Formula(
             ArithmeticOperator.DIVIDE.value,
             [
                 Timeseries(
-                    metric=Metric(public_name="foo"),
+                    metric=FOO_METRIC,
                     aggregate="sum",
                 ),
                 Timeseries(
-                    metric=Metric(public_name="bar"),
+                    metric=BAR_METRIC,
                     aggregate="sum",
                 ),
             ],
-            filters=[Condition(Column("tag"), Op.EQ, "tag_value")],
+            filters=[TAG_EQ_TAG_VALUE],
             groupby=[Column("transaction")],
         ),
         id="test terms with groupby 1",
     ),
     pytest.param(
         "(sum(foo) by transaction / sum(bar) by transaction)",
-        Formula(
+        lambda: Formula(
             ArithmeticOperator.DIVIDE.value,
             [
                 Timeseries(
-                    metric=Metric(public_name="foo"),
+                    metric=FOO_METRIC,
                     aggregate="sum",
                     groupby=[Column("transaction")],
                 ),
                 Timeseries(
-                    metric=Metric(public_name="bar"),
+                    metric=BAR_METRIC,
                     aggregate="sum",
                     groupby=[Column("transaction")],
                 ),
@@ -809,82 +825,63 @@ term_tests = [
     ),
     pytest.param(
         '(sum(foo) by transaction / sum(bar) by transaction){tag:"tag_value"}',
-        Formula(
+        lambda: Formula(
             ArithmeticOperator.DIVIDE.value,
             [
                 Timeseries(
-                    metric=Metric(public_name="foo"),
+                    metric=FOO_METRIC,
                     aggregate="sum",
                     groupby=[Column("transaction")],
                 ),
                 Timeseries(
-                    metric=Metric(public_name="bar"),
+                    metric=BAR_METRIC,
                     aggregate="sum",
                     groupby=[Column("transaction")],
                 ),
             ],
-            filters=[Condition(Column("tag"), Op.EQ, "tag_value")],
+            filters=[TAG_EQ_TAG_VALUE],
         ),
         id="test terms with groupby 3",
     ),
     pytest.param(
         '(sum(foo{tag:"tag_value"}) by transaction) / (sum(bar{tag:"tag_value"}) by transaction)',
-        Formula(
+        lambda: Formula(
             ArithmeticOperator.DIVIDE.value,
             [
                 Timeseries(
-                    metric=Metric(public_name="foo"),
+                    metric=FOO_METRIC,
                     aggregate="sum",
-                    filters=[Condition(Column("tag"), Op.EQ, "tag_value")],
+                    filters=[TAG_EQ_TAG_VALUE],
                     groupby=[Column("transaction")],
                 ),
                 Timeseries(
-                    metric=Metric(public_name="bar"),
+                    metric=BAR_METRIC,
                     aggregate="sum",
-                    filters=[Condition(Column("tag"), Op.EQ, "tag_value")],
+                    filters=[TAG_EQ_TAG_VALUE],
                     groupby=[Column("transaction")],
                 ),
             ],
         ),
         id="test terms with groupby 4",
     ),
-    pytest.param(
-        '(sum(foo) / sum(bar)){tag:"tag_value"} by transaction',
-        Formula(
-            ArithmeticOperator.DIVIDE.value,
-            [
-                Timeseries(
-                    metric=Metric(public_name="foo"),
-                    aggregate="sum",
-                ),
-                Timeseries(
-                    metric=Metric(public_name="bar"),
-                    aggregate="sum",
-                ),
-            ],
-            filters=[Condition(Column("tag"), Op.EQ, "tag_value")],
-            groupby=[Column("transaction")],
-        ),
-        id="test terms with groupby 5",
-    ),
     pytest.param(
         '((sum(foo{tag:"tag_value"}){tag2:"tag_value2"} / sum(bar)){tag3:"tag_value3"} + sum(pop)) by transaction',
-        Formula(
+        lambda: Formula(
             function_name=ArithmeticOperator.PLUS.value,
             parameters=[
                 Formula(
                     ArithmeticOperator.DIVIDE.value,
                     [
                         Timeseries(
-                            metric=Metric(public_name="foo"),
+                            metric=FOO_METRIC,
                             aggregate="sum",
                             filters=[
                                 Condition(Column("tag2"), Op.EQ, "tag_value2"),
-                                Condition(Column("tag"), Op.EQ, "tag_value"),
+                                TAG_EQ_TAG_VALUE,
                             ],
                         ),
                         Timeseries(
-                            metric=Metric(public_name="bar"),
+                            metric=BAR_METRIC,
                             aggregate="sum",
                         ),
                     ],
@@ -901,21 +898,19 @@ term_tests = [
     ),
     pytest.param(
         "count(c:custom/page_click@none) + max(d:custom/app_load@millisecond) / count(c:custom/page_click@none)",
-        Formula(
+        lambda: Formula(
             function_name=ArithmeticOperator.PLUS.value,
             parameters=[
-                Timeseries(
-                    metric=Metric(mri="c:custom/page_click@none"), aggregate="count"
-                ),
+                Timeseries(metric=PAGE_CLICK_MRI_METRIC, aggregate="count"),
                 Formula(
                     function_name=ArithmeticOperator.DIVIDE.value,
                     parameters=[
                         Timeseries(
-                            metric=Metric(mri="d:custom/app_load@millisecond"),
+                            metric=APP_LOAD_MRI_METRIC,
                             aggregate="max",
                         ),
                         Timeseries(
-                            metric=Metric(mri="c:custom/page_click@none"),
+                            metric=PAGE_CLICK_MRI_METRIC,
                             aggregate="count",
                         ),
                     ],
@@ -926,36 +921,34 @@ term_tests = [
     ),
     pytest.param(
         "count(c:custom/page_click@none) + max(d:custom/app_load@millisecond) + count(c:custom/page_click@none)",
-        Formula(
+        lambda: Formula(
             function_name=ArithmeticOperator.PLUS.value,
             parameters=[
                 Formula(
                     function_name=ArithmeticOperator.PLUS.value,
                     parameters=[
                         Timeseries(
-                            metric=Metric(mri="c:custom/page_click@none"),
+                            metric=PAGE_CLICK_MRI_METRIC,
                             aggregate="count",
                         ),
                         Timeseries(
-                            metric=Metric(mri="d:custom/app_load@millisecond"),
+                            metric=APP_LOAD_MRI_METRIC,
                             aggregate="max",
                         ),
                     ],
                 ),
-                Timeseries(
-                    metric=Metric(mri="c:custom/page_click@none"), aggregate="count"
-                ),
+                Timeseries(metric=PAGE_CLICK_MRI_METRIC, aggregate="count"),
             ],
         ),
         id="test expression with associativity",
     ),
     pytest.param(
         "-count(c:custom/page_click@none)",
-        Formula(
+        lambda: Formula(
             function_name="negate",
             parameters=[
                 Timeseries(
-                    metric=Metric(mri="c:custom/page_click@none"),
+                    metric=PAGE_CLICK_MRI_METRIC,
                     aggregate="count",
                 ),
             ],
@@ -964,14 +957,14 @@ term_tests = [
     ),
     pytest.param(
         "-(-count(c:custom/page_click@none))",
-        Formula(
+        lambda: Formula(
             function_name="negate",
             parameters=[
                 Formula(
                     function_name="negate",
                     parameters=[
                         Timeseries(
-                            metric=Metric(mri="c:custom/page_click@none"),
+                            metric=PAGE_CLICK_MRI_METRIC,
                             aggregate="count",
                         ),
                     ],
@@ -982,11 +975,11 @@ term_tests = [
     ),
     pytest.param(
         "count(c:custom/page_click@none) - -1",
-        Formula(
+        lambda: Formula(
             function_name=ArithmeticOperator.MINUS.value,
             parameters=[
                 Timeseries(
-                    metric=Metric(mri="c:custom/page_click@none"),
+                    metric=PAGE_CLICK_MRI_METRIC,
                     aggregate="count",
                 ),
                 -1,
@@ -996,14 +989,14 @@ term_tests = [
     ),
     pytest.param(
         "-(count(c:custom/page_click@none) + -1)",
-        Formula(
+        lambda: Formula(
             function_name="negate",
             parameters=[
                 Formula(
                     function_name=ArithmeticOperator.PLUS.value,
                     parameters=[
                         Timeseries(
-                            metric=Metric(mri="c:custom/page_click@none"),
+                            metric=PAGE_CLICK_MRI_METRIC,
                             aggregate="count",
                         ),
                         -1,
@@ -1015,18 +1008,18 @@ term_tests = [
     ),
     pytest.param(
         "count(c:custom/page_click@none) + -max(d:custom/app_load@millisecond)",
-        Formula(
+        lambda: Formula(
             function_name=ArithmeticOperator.PLUS.value,
             parameters=[
                 Timeseries(
-                    metric=Metric(mri="c:custom/page_click@none"),
+                    metric=PAGE_CLICK_MRI_METRIC,
                     aggregate="count",
                 ),
                 Formula(
                     function_name="negate",
                     parameters=[
                         Timeseries(
-                            metric=Metric(mri="d:custom/app_load@millisecond"),
+                            metric=APP_LOAD_MRI_METRIC,
                             aggregate="max",
                         ),
                     ],
@@ -1037,11 +1030,11 @@ term_tests = [
     ),
     pytest.param(
         "count(c:custom/page_click@none) + (-1 + -max(d:custom/app_load@millisecond))",
-        Formula(
+        lambda: Formula(
             function_name=ArithmeticOperator.PLUS.value,
             parameters=[
                 Timeseries(
-                    metric=Metric(mri="c:custom/page_click@none"),
+                    metric=PAGE_CLICK_MRI_METRIC,
                     aggregate="count",
                 ),
                 Formula(
@@ -1052,7 +1045,7 @@ term_tests = [
                             function_name="negate",
                             parameters=[
                                 Timeseries(
-                                    metric=Metric(mri="d:custom/app_load@millisecond"),
+                                    metric=APP_LOAD_MRI_METRIC,
                                     aggregate="max",
                                 ),
                             ],
@@ -1066,20 +1059,14 @@ term_tests = [
 ]
 
 
-@pytest.mark.parametrize("mql_string, metrics_query", term_tests)
-def test_parse_mql_terms(mql_string: str, metrics_query: Formula | Timeseries) -> None:
-    result = parse_mql(mql_string)
-    assert result == metrics_query
-
-
 arbitrary_function_tests = [
     pytest.param(
         "simple_function(sum(transaction.duration))",
-        Formula(
+        lambda: Formula(
             "simple_function",
             [
                 Timeseries(
-                    metric=Metric(public_name="transaction.duration"),
+                    metric=TXN_DURATION_METRIC,
                     aggregate="sum",
                 ),
             ],
@@ -1088,7 +1075,7 @@ arbitrary_function_tests = [
     ),
     pytest.param(
         'another_function("test", 500)',
-        Formula(
+        lambda: Formula(
             "another_function",
             [
                 "test",
@@ -1099,11 +1086,11 @@ arbitrary_function_tests = [
     ),
     pytest.param(
         "sum(count(transaction.duration))",
-        Formula(
+        lambda: Formula(
             "sum",
             [
                 Timeseries(
-                    metric=Metric(public_name="transaction.duration"),
+                    metric=TXN_DURATION_METRIC,
                     aggregate="count",
                 ),
             ],
@@ -1112,27 +1099,27 @@ arbitrary_function_tests = [
     ),
     pytest.param(
         'apdex(sum(transaction.duration), 500){tag:"tag_value"} by transaction',
-        Formula(
+        lambda: Formula(
             function_name="apdex",
             parameters=[
                 Timeseries(
-                    metric=Metric(public_name="transaction.duration"),
+                    metric=TXN_DURATION_METRIC,
                     aggregate="sum",
                 ),
                 500,
             ],
-            filters=[Condition(Column("tag"), Op.EQ, "tag_value")],
+            filters=[TAG_EQ_TAG_VALUE],
             groupby=[Column("transaction")],
         ),
         id="test arbitrary function with filters and groupby",
     ),
     pytest.param(
         "apdex(quantiles(0.5)(transaction.duration), 500)",
-        Formula(
+        lambda: Formula(
             "apdex",
             [
                 Timeseries(
-                    metric=Metric(public_name="transaction.duration"),
+                    metric=TXN_DURATION_METRIC,
                     aggregate="quantiles",
                     aggregate_params=[0.5],
                 ),
@@ -1143,14 +1130,14 @@ arbitrary_function_tests = [
     ),
     pytest.param(
         "apdex(failure_rate(sum(transaction.duration)), 500)",
-        Formula(
+        lambda: Formula(
             "apdex",
             [
                 Formula(
                     function_name="failure_rate",
                     parameters=[
                         Timeseries(
-                            metric=Metric(public_name="transaction.duration"),
+                            metric=TXN_DURATION_METRIC,
                             aggregate="sum",
                         )
                     ],
@@ -1162,56 +1149,56 @@ arbitrary_function_tests = [
     ),
     pytest.param(
         'topK(sum(transaction.duration), 500, 4.2){tag:"tag_value"} by transaction',
-        Formula(
+        lambda: Formula(
             function_name="topK",
             parameters=[
                 Timeseries(
-                    metric=Metric(public_name="transaction.duration"),
+                    metric=TXN_DURATION_METRIC,
                     aggregate="sum",
                 ),
                 500,
                 4.2,
             ],
-            filters=[Condition(Column("tag"), Op.EQ, "tag_value")],
+            filters=[TAG_EQ_TAG_VALUE],
             groupby=[Column("transaction")],
         ),
-        id="test arbitrary function with filters and groupby",
+        id="test arbitrary function with multiple parameters, filters and groupby",
     ),
     pytest.param(
         'apdex(sum(foo) / sum(bar), 500){tag:"tag_value"} by transaction',
-        Formula(
+        lambda: Formula(
             function_name="apdex",
             parameters=[
                 Formula(
                     function_name=ArithmeticOperator.DIVIDE.value,
                     parameters=[
                         Timeseries(
-                            metric=Metric(public_name="foo"),
+                            metric=FOO_METRIC,
                             aggregate="sum",
                         ),
                         Timeseries(
-                            metric=Metric(public_name="bar"),
+                            metric=BAR_METRIC,
                             aggregate="sum",
                         ),
                     ],
                 ),
                 500,
             ],
-            filters=[Condition(Column("tag"), Op.EQ, "tag_value")],
+            filters=[TAG_EQ_TAG_VALUE],
             groupby=[Column("transaction")],
         ),
         id="test arbitrary function with inner terms",
     ),
     pytest.param(
         "apdex(sum(transaction.duration), 500) * failure_rate(sum(transaction.duration))",
-        Formula(
+        lambda: Formula(
             function_name="multiply",
             parameters=[
                 Formula(
                     function_name="apdex",
                     parameters=[
                         Timeseries(
-                            metric=Metric(public_name="transaction.duration"),
+                            metric=TXN_DURATION_METRIC,
                             aggregate="sum",
                         ),
                         500,
@@ -1221,7 +1208,7 @@ arbitrary_function_tests = [
                     function_name="failure_rate",
                     parameters=[
                         Timeseries(
-                            metric=Metric(public_name="transaction.duration"),
+                            metric=TXN_DURATION_METRIC,
                             aggregate="sum",
                         )
                     ],
@@ -1232,11 +1219,11 @@ arbitrary_function_tests = [
     ),
     pytest.param(
         "rate(count(g:custom/zone.domains@none))",
-        Formula(
+        lambda: Formula(
             function_name="rate",
             parameters=[
                 Timeseries(
-                    metric=Metric(mri="g:custom/zone.domains@none"),
+                    metric=ZONE_DOMAINS_MRI_METRIC,
                     aggregate="count",
                 ),
             ],
@@ -1245,11 +1232,11 @@ arbitrary_function_tests = [
     ),
     pytest.param(
         "rate(count(g:custom/zone.domains@none){hello:world})",
-        Formula(
+        lambda: Formula(
             function_name="rate",
             parameters=[
                 Timeseries(
-                    metric=Metric(mri="g:custom/zone.domains@none"),
+                    metric=ZONE_DOMAINS_MRI_METRIC,
                     aggregate="count",
                     filters=[Condition(Column("hello"), Op.EQ, "world")],
                 ),
@@ -1259,11 +1246,11 @@ arbitrary_function_tests = [
     ),
     pytest.param(
         'rate(count(g:custom/zone.domains@none), 10, "hello")',
-        Formula(
+        lambda: Formula(
             function_name="rate",
             parameters=[
                 Timeseries(
-                    metric=Metric(mri="g:custom/zone.domains@none"),
+                    metric=ZONE_DOMAINS_MRI_METRIC,
                     aggregate="count",
                 ),
                 10,
@@ -1275,18 +1262,10 @@ arbitrary_function_tests = [
 ]
 
 
-@pytest.mark.parametrize("mql_string, metrics_query", arbitrary_function_tests)
-def test_parse_mql_arbitrary_functions(
-    mql_string: str, metrics_query: Formula | Timeseries
-) -> None:
-    result = parse_mql(mql_string)
-    assert result == metrics_query
-
-
 curried_arbitrary_function_tests = [
     pytest.param(
         'topK(10)("test.duration")',
-        Formula(
+        lambda: Formula(
             function_name="topK",
             aggregate_params=[10],
             parameters=["test.duration"],
@@ -1295,12 +1274,12 @@ curried_arbitrary_function_tests = [
     ),
     pytest.param(
         "topK(10)(sum(transaction.duration))",
-        Formula(
+        lambda: Formula(
             function_name="topK",
             aggregate_params=[10],
             parameters=[
                 Timeseries(
-                    metric=Metric(public_name="transaction.duration"),
+                    metric=TXN_DURATION_METRIC,
                     aggregate="sum",
                 ),
             ],
@@ -1309,12 +1288,12 @@ curried_arbitrary_function_tests = [
     ),
     pytest.param(
         'topK(10)(sum(transaction.duration), 500, "test")',
-        Formula(
+        lambda: Formula(
             function_name="topK",
             aggregate_params=[10],
             parameters=[
                 Timeseries(
-                    metric=Metric(public_name="transaction.duration"),
+                    metric=TXN_DURATION_METRIC,
                     aggregate="sum",
                 ),
                 500,
@@ -1325,16 +1304,16 @@ curried_arbitrary_function_tests = [
     ),
     pytest.param(
         "topK(10)(sum(transaction.duration), count(transaction.duration))",
-        Formula(
+        lambda: Formula(
             function_name="topK",
             aggregate_params=[10],
             parameters=[
                 Timeseries(
-                    metric=Metric(public_name="transaction.duration"),
+                    metric=TXN_DURATION_METRIC,
                     aggregate="sum",
                 ),
                 Timeseries(
-                    metric=Metric(public_name="transaction.duration"),
+                    metric=TXN_DURATION_METRIC,
                     aggregate="count",
                 ),
             ],
@@ -1343,7 +1322,7 @@ curried_arbitrary_function_tests = [
     ),
     pytest.param(
         "topK(10)(sum(transaction.duration) / count(transaction.duration))",
-        Formula(
+        lambda: Formula(
             function_name="topK",
             aggregate_params=[10],
             parameters=[
@@ -1351,11 +1330,11 @@ curried_arbitrary_function_tests = [
                     function_name="divide",
                     parameters=[
                         Timeseries(
-                            metric=Metric(public_name="transaction.duration"),
+                            metric=TXN_DURATION_METRIC,
                             aggregate="sum",
                         ),
                         Timeseries(
-                            metric=Metric(public_name="transaction.duration"),
+                            metric=TXN_DURATION_METRIC,
                             aggregate="count",
                         ),
                     ],
@@ -1366,7 +1345,7 @@ curried_arbitrary_function_tests = [
     ),
     pytest.param(
         "topK(10)(sum(transaction.duration{bar:baz}) / count(transaction.duration{foo:foz})) by transaction",
-        Formula(
+        lambda: Formula(
             function_name="topK",
             aggregate_params=[10],
             parameters=[
@@ -1374,14 +1353,14 @@ curried_arbitrary_function_tests = [
                     function_name="divide",
                     parameters=[
                         Timeseries(
-                            metric=Metric(public_name="transaction.duration"),
+                            metric=TXN_DURATION_METRIC,
                             aggregate="sum",
-                            filters=[Condition(Column("bar"), Op.EQ, "baz")],
+                            filters=[BAR_EQ_BAZ],
                         ),
                         Timeseries(
-                            metric=Metric(public_name="transaction.duration"),
+                            metric=TXN_DURATION_METRIC,
                             aggregate="count",
-                            filters=[Condition(Column("foo"), Op.EQ, "foz")],
+                            filters=[FOO_EQ_FOZ],
                         ),
                     ],
                 ),
@@ -1392,15 +1371,15 @@ curried_arbitrary_function_tests = [
     ),
     pytest.param(
         "topK(10)(topK(5)(transaction.duration){bar:baz})",
-        Formula(
+        lambda: Formula(
             function_name="topK",
             aggregate_params=[10],
             parameters=[
                 Timeseries(
-                    metric=Metric(public_name="transaction.duration"),
+                    metric=TXN_DURATION_METRIC,
                     aggregate="topK",
                     aggregate_params=[5],
-                    filters=[Condition(Column("bar"), Op.EQ, "baz")],
+                    filters=[BAR_EQ_BAZ],
                 ),
             ],
         ),
@@ -1408,7 +1387,7 @@ curried_arbitrary_function_tests = [
     ),
     pytest.param(
         "topK(10)(apdex(sum(transaction.duration), 500){bar:baz})",
-        Formula(
+        lambda: Formula(
             function_name="topK",
             aggregate_params=[10],
             parameters=[
@@ -1416,12 +1395,12 @@ curried_arbitrary_function_tests = [
                     function_name="apdex",
                     parameters=[
                         Timeseries(
-                            metric=Metric(public_name="transaction.duration"),
+                            metric=TXN_DURATION_METRIC,
                             aggregate="sum",
                         ),
                         500,
                     ],
-                    filters=[Condition(Column("bar"), Op.EQ, "baz")],
+                    filters=[BAR_EQ_BAZ],
                 ),
             ],
         ),
@@ -1430,9 +1409,23 @@ curried_arbitrary_function_tests = [
 ]
 
 
-@pytest.mark.parametrize("mql_string, metrics_query", curried_arbitrary_function_tests)
-def test_parse_mql_curried_arbitrary_functions(
-    mql_string: str, metrics_query: Formula | Timeseries
+@pytest.mark.parametrize(
+    "mql_string, metrics_query_factory",
+    base_tests
+    + term_tests
+    + arbitrary_function_tests
+    + curried_arbitrary_function_tests,
+)
+def test_parse_mql(
+    mql_string: str, metrics_query_factory: Callable[[], Formula | Timeseries]
 ) -> None:
     result = parse_mql(mql_string)
-    assert result == metrics_query
+    assert result == metrics_query_factory()
+
+
+def test_parse_mql_returns_fresh_objects() -> None:
+    mql = 'sum(foo){bar:"baz"} by transaction'
+    first = parse_mql(mql)
+    second = parse_mql(mql)
+    assert first == second
+    assert first is not second